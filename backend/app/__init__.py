@@ -1,9 +1,26 @@
-from backend.app.seed import seed_clubs
-from backend.app.seed.seed_drills import seed_drills
-
 from pathlib import Path
-from alembic.config import Config
-
 
 BASE_DIR = Path(__file__).resolve().parents[2]  # стига до root
-alembic_cfg = Config(str(BASE_DIR / "alembic.ini"))
+
+# Heavy package attributes, resolved on first access (PEP 562) so that
+# importing any backend.app submodule does not load seeds or Alembic.
+_LAZY_ATTRIBUTES = {
+    "seed_clubs": ("backend.app.seed", "seed_clubs"),
+    "seed_drills": ("backend.app.seed.seed_drills", "seed_drills"),
+}
+
+
+def __getattr__(name):
+    if name == "alembic_cfg":
+        from alembic.config import Config
+
+        value = Config(str(BASE_DIR / "alembic.ini"))
+    elif name in _LAZY_ATTRIBUTES:
+        from importlib import import_module
+
+        module, attribute = _LAZY_ATTRIBUTES[name]
+        value = getattr(import_module(module), attribute)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
@@ -1,5 +1,10 @@
-from datetime import datetime, timedelta
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+import hashlib
+import hmac
 import os
+import secrets
 from typing import Any, Dict, Optional
 
 from jose import JWTError, jwt
@@ -11,13 +16,26 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 SECRET_KEY = os.getenv("JWT_SECRET", settings.jwt_secret)
 ALGORITHM = settings.jwt_algorithm
-ACCESS_TOKEN_EXPIRE_MINUTES = 60
+ACCESS_TOKEN_EXPIRE_MINUTES = settings.access_token_expires_minutes
+REFRESH_TOKEN_EXPIRE_MINUTES = settings.refresh_token_expires_minutes
+
+
+# bcrypt is CPU-bound by design; run it on a small bounded pool off the event loop
+_bcrypt_executor = ThreadPoolExecutor(
+    max_workers=settings.bcrypt_max_workers,
+    thread_name_prefix="bcrypt",
+)
 
 
 def verify_password(plain_password: str, password_hash: str) -> bool:
     return pwd_context.verify(plain_password, password_hash)
 
 
+async def verify_password_async(plain_password: str, password_hash: str) -> bool:
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_bcrypt_executor, verify_password, plain_password, password_hash)
+
+
 def get_password_hash(plain_password: str) -> str:
     return pwd_context.hash(plain_password)
 
@@ -33,3 +51,20 @@ def create_access_token(data: Dict[str, Any], expires_delta: Optional[timedelta]
 def decode_token(token: str) -> Dict[str, Any]:
     payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
     return payload
+
+
+def new_refresh_token() -> str:
+    return secrets.token_urlsafe(32)
+
+
+def new_token_family() -> str:
+    return secrets.token_hex(16)
+
+
+def hash_refresh_token(token: str) -> str:
+    """Keyed hash stored in place of the refresh token itself."""
+    return hmac.new(SECRET_KEY.encode(), token.encode(), hashlib.sha256).hexdigest()
+
+
+def refresh_token_expiry() -> datetime:
+    return datetime.now(timezone.utc) + timedelta(minutes=REFRESH_TOKEN_EXPIRE_MINUTES)
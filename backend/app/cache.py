@@ -0,0 +1,282 @@
+"""In-process, versioned cache for serialized catalog payloads.
+
+Each namespace ("drills", "clubs") carries a version counter. Cached
+payloads are keyed by ``(namespace, version, key)``, so bumping the version
+on any write makes every older entry unreachable; stale entries then age
+out of the bounded LRU.
+
+Bumps caused by ORM commits also record which primary keys changed, so
+derived in-memory structures can refresh just those rows instead of
+rebuilding from scratch. Every local bump is broadcast to the other worker
+processes (see ``invalidation.py``), which replay it on their own cache.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from dataclasses import dataclass, field
+from typing import Callable, Deque, Dict, FrozenSet, Hashable, Iterable, Optional, Set, Tuple
+
+import orjson
+from fastapi import Request, Response, status
+from fastapi.encoders import jsonable_encoder
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from backend.app import invalidation
+from backend.app.models import Club, Drill, DrillTag, User
+from backend.app.settings import settings
+
+# ORM classes whose changes invalidate a cached namespace
+NAMESPACE_MODELS = {
+    Drill: "drills",
+    DrillTag: "drills",
+    Club: "clubs",
+    # Rosters and member counts are served from the clubs namespace
+    User: "clubs",
+}
+
+# Attribute holding the changed key for models whose changes are tracked per row
+CHANGE_KEYS = {
+    Drill: "id",
+    DrillTag: "drill_id",
+    Club: "id",
+}
+
+# Bumps remembered per namespace for incremental refreshes
+CHANGE_LOG_SIZE = 64
+
+
+@dataclass(frozen=True)
+class CachedPayload:
+    body: bytes
+    etag: str
+    headers: Dict[str, str] = field(default_factory=dict)
+
+
+def _encode_default(value):
+    if isinstance(value, BaseModel):
+        return value.model_dump()
+    return jsonable_encoder(value)
+
+
+def encode_payload(data, headers: Optional[Dict[str, str]] = None) -> CachedPayload:
+    body = orjson.dumps(data, default=_encode_default)
+    return CachedPayload(
+        body=body,
+        etag='"' + hashlib.sha256(body).hexdigest()[:32] + '"',
+        headers=headers or {},
+    )
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    candidates = [value.strip() for value in if_none_match.split(",")]
+    return "*" in candidates or any(value.removeprefix("W/") == etag for value in candidates)
+
+
+def cached_response(request: Request, payload: CachedPayload) -> Response:
+    """Render a cached payload, answering a matching If-None-Match with 304."""
+    headers = {**payload.headers, "ETag": payload.etag}
+    if _etag_matches(request.headers.get("if-none-match"), payload.etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=payload.body, media_type="application/json", headers=headers)
+
+
+class CatalogCache:
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Tuple, CachedPayload]" = OrderedDict()
+        self._versions: Dict[str, int] = {}
+        self._changes: Dict[str, Deque[Tuple[int, Optional[FrozenSet]]]] = {}
+        self._lock = threading.Lock()
+
+    def version(self, namespace: str) -> int:
+        return self._versions.get(namespace, 0)
+
+    def bump(self, namespace: str, keys: Optional[Iterable[Hashable]] = None, broadcast: bool = True) -> int:
+        """Advance ``namespace``; ``keys`` names the changed rows when known."""
+        keys = None if keys is None else frozenset(keys)
+        with self._lock:
+            version = self.version(namespace) + 1
+            self._versions[namespace] = version
+            log = self._changes.setdefault(namespace, deque(maxlen=CHANGE_LOG_SIZE))
+            log.append((version, keys))
+        if broadcast:
+            invalidation.broadcaster.publish(
+                "bump", namespace=namespace, keys=None if keys is None else sorted(keys)
+            )
+        return version
+
+    def bump_all(self) -> None:
+        for namespace in set(NAMESPACE_MODELS.values()) | set(self._versions):
+            self.bump(namespace, broadcast=False)
+
+    def changes_since(self, namespace: str, version: int) -> Optional[Set[Hashable]]:
+        """Keys changed after ``version``, or None if any bump did not record them."""
+        with self._lock:
+            current = self.version(namespace)
+            entries = [keys for bumped, keys in self._changes.get(namespace, ()) if bumped > version]
+        if len(entries) != current - version or any(keys is None for keys in entries):
+            return None
+        return set().union(*entries)
+
+    def get(self, namespace: str, key: Hashable) -> Optional[CachedPayload]:
+        cache_key = (namespace, self.version(namespace), key)
+        with self._lock:
+            payload = self._entries.get(cache_key)
+            if payload is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(cache_key)
+            self.hits += 1
+            return payload
+
+    def get_or_build(self, namespace: str, key: Hashable, build: Callable[[], CachedPayload]) -> CachedPayload:
+        # Capture the version before building so a concurrent write cannot
+        # leave a stale payload stored under the new version.
+        version = self.version(namespace)
+        payload = self.get(namespace, key)
+        if payload is not None:
+            return payload
+
+        payload = build()
+        with self._lock:
+            self._entries[(namespace, version, key)] = payload
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return payload
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            **{f"version_{name}": version for name, version in self._versions.items()},
+        }
+
+
+catalog_cache = CatalogCache(max_entries=settings.catalog_cache_max_entries)
+
+invalidation.register(
+    "bump", lambda message: catalog_cache.bump(message["namespace"], message.get("keys"), broadcast=False)
+)
+invalidation.register("resync", lambda message: catalog_cache.bump_all())
+
+
+class TTLCache:
+    """Bounded LRU whose entries also expire after ``ttl_seconds``."""
+
+    def __init__(self, max_entries: int, ttl_seconds: float):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self._entries: "OrderedDict[Hashable, Tuple[float, object]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= time.monotonic():
+                if entry is not None:
+                    del self._entries[key]
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[1]
+
+    def set(self, key: Hashable, value, ttl_seconds: Optional[float] = None) -> None:
+        ttl = self.ttl_seconds if ttl_seconds is None else min(ttl_seconds, self.ttl_seconds)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + ttl, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def discard_where(self, predicate: Callable[[object], bool]) -> int:
+        with self._lock:
+            stale = [key for key, (_, value) in self._entries.items() if predicate(value)]
+            for key in stale:
+                del self._entries[key]
+            return len(stale)
+
+    def stats(self) -> Dict[str, float]:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "max_entries": self.max_entries,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+        }
+
+
+class VersionedSnapshot:
+    """In-memory structure derived from a namespace, rebuilt when its version moves.
+
+    With ``refresh``, a move whose changed keys are known calls
+    ``refresh(value, db, keys)`` instead; it returns the updated value, or
+    None to fall back to a full rebuild.
+    """
+
+    def __init__(
+        self,
+        namespace: str,
+        build: Callable[[Session], object],
+        refresh: Optional[Callable[[object, Session, Set[Hashable]], object]] = None,
+    ):
+        self.namespace = namespace
+        self._build = build
+        self._refresh = refresh
+        self._value = None
+        self._version = -1
+        self._lock = threading.Lock()
+
+    def get(self, db: Session):
+        with self._lock:
+            version = catalog_cache.version(self.namespace)
+            if self._value is not None and self._version == version:
+                return self._value
+
+            value = None
+            if self._value is not None and self._refresh is not None:
+                keys = catalog_cache.changes_since(self.namespace, self._version)
+                if keys is not None:
+                    value = self._refresh(self._value, db, keys)
+            self._value = value if value is not None else self._build(db)
+            self._version = version
+            return self._value
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_namespaces(session, flush_context) -> None:
+    # namespace -> changed keys, or None once an untracked model is involved
+    changed = session.info.setdefault("changed_namespaces", {})
+    for obj in (*session.new, *session.dirty, *session.deleted):
+        namespace = NAMESPACE_MODELS.get(type(obj))
+        if not namespace:
+            continue
+        key_attr = CHANGE_KEYS.get(type(obj))
+        if key_attr is None:
+            changed[namespace] = None
+        elif namespace not in changed or changed[namespace] is not None:
+            changed.setdefault(namespace, set()).add(getattr(obj, key_attr))
+
+
+@event.listens_for(Session, "after_commit")
+def _bump_changed_namespaces(session) -> None:
+    for namespace, keys in session.info.pop("changed_namespaces", {}).items():
+        catalog_cache.bump(namespace, keys)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_namespaces(session) -> None:
+    session.info.pop("changed_namespaces", None)
@@ -0,0 +1,107 @@
+"""Array-backed snapshot of the drill catalog.
+
+The training generator (and anything else that scores drills in bulk) works
+on this snapshot instead of issuing ORM queries per request. Columns are
+NumPy arrays aligned by row; missing numeric values are stored as NaN and
+packed tag columns become boolean one-hot matrices.
+"""
+
+from typing import Dict, Iterable, List, Mapping, Optional, Sequence
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.cache import VersionedSnapshot
+from backend.app.models import Drill
+from backend.app.tags import parse_tags
+
+CATALOG_COLUMNS = (
+    "id",
+    "name",
+    "duration_min",
+    "duration_max",
+    "age_min",
+    "age_max",
+    "complexity_level",
+    "decision_level",
+    "intensity_type",
+    "skill_domains",
+    "game_phases",
+)
+
+
+def _float_array(rows: Sequence[Mapping], key: str) -> np.ndarray:
+    return np.array(
+        [np.nan if row[key] is None else float(row[key]) for row in rows],
+        dtype=np.float64,
+    )
+
+
+def _one_hot(rows: Sequence[Mapping], key: str):
+    parsed = [parse_tags(row[key]) for row in rows]
+    vocab: Dict[str, int] = {}
+    for tags in parsed:
+        for tag in tags:
+            vocab.setdefault(tag, len(vocab))
+
+    matrix = np.zeros((len(rows), len(vocab)), dtype=bool)
+    for i, tags in enumerate(parsed):
+        for tag in tags:
+            matrix[i, vocab[tag]] = True
+    return matrix, vocab
+
+
+class DrillCatalog:
+    def __init__(self, rows: Sequence[Mapping]):
+        self.ids = np.array([row["id"] for row in rows], dtype=np.int64)
+        self.names: List[str] = [row["name"] or "" for row in rows]
+
+        self.duration_min = _float_array(rows, "duration_min")
+        self.duration_max = _float_array(rows, "duration_max")
+        self.age_min = _float_array(rows, "age_min")
+        self.age_max = _float_array(rows, "age_max")
+        self.complexity = _float_array(rows, "complexity_level")
+        self.decision = _float_array(rows, "decision_level")
+
+        self.intensity_vocab: Dict[str, int] = {}
+        self.intensity = np.array(
+            [
+                self.intensity_vocab.setdefault(value, len(self.intensity_vocab))
+                for value in ((row["intensity_type"] or "").strip().lower() for row in rows)
+            ],
+            dtype=np.int32,
+        )
+        self.intensity_labels: List[str] = list(self.intensity_vocab)
+
+        self.domains, self.domain_vocab = _one_hot(rows, "skill_domains")
+        self.phases, self.phase_vocab = _one_hot(rows, "game_phases")
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    @classmethod
+    def from_session(cls, db: Session) -> "DrillCatalog":
+        columns = [getattr(Drill, name) for name in CATALOG_COLUMNS]
+        rows = db.execute(select(*columns).order_by(Drill.id)).mappings().all()
+        return cls(rows)
+
+    def age_mask(self, age: Optional[int]) -> np.ndarray:
+        if age is None:
+            return np.ones(len(self), dtype=bool)
+        # NaN bounds are open; comparisons with NaN are False, hence the negations
+        return ~(self.age_min > age) & ~(self.age_max < age)
+
+    def domain_columns(self, tags: Iterable[str]) -> List[int]:
+        return [self.domain_vocab[tag] for tag in tags if tag in self.domain_vocab]
+
+    def tags_for(self, row: int) -> List[str]:
+        return [tag for tag, col in self.domain_vocab.items() if self.domains[row, col]]
+
+
+_snapshot = VersionedSnapshot("drills", DrillCatalog.from_session)
+
+
+def get_catalog(db: Session) -> DrillCatalog:
+    """Return the catalog snapshot, rebuilding it when the drills version moved."""
+    return _snapshot.get(db)
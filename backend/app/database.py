@@ -1,12 +1,145 @@
-from sqlalchemy import create_engine
+import threading
+import time
+from typing import AsyncIterator, Dict
+
+from sqlalchemy import create_engine, event
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
 from backend.app.settings import settings
 
+
+class PoolStats:
+    """Counters for one engine's connection pool."""
+
+    def __init__(self):
+        self.connects = 0
+        self.checkouts = 0
+        self.checkins = 0
+        self.invalidations = 0
+        self.waits = 0
+        self.wait_seconds = 0.0
+        self.timeouts = 0
+        self.overflow_peak = 0
+        self._lock = threading.Lock()
+
+    # Pool events fire from every thread that checks out; += is not atomic
+    def increment(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    def record_overflow(self, overflow: int) -> None:
+        with self._lock:
+            self.overflow_peak = max(self.overflow_peak, overflow)
+
+    def record_wait(self, seconds: float) -> None:
+        with self._lock:
+            self.waits += 1
+            self.wait_seconds += seconds
+
+    def snapshot(self, pool) -> Dict[str, float]:
+        stats = {
+            "connects": self.connects,
+            "checkouts": self.checkouts,
+            "checkins": self.checkins,
+            "invalidations": self.invalidations,
+            "waits": self.waits,
+            "wait_seconds": round(self.wait_seconds, 6),
+            "timeouts": self.timeouts,
+            "overflow_peak": self.overflow_peak,
+        }
+        if isinstance(pool, QueuePool):
+            stats.update(
+                size=pool.size(),
+                checked_out=pool.checkedout(),
+                checked_in=pool.checkedin(),
+                overflow=max(pool.overflow(), 0),
+            )
+        return stats
+
+
+class _WaitTimingMixin:
+    """Times checkouts that had to queue for a connection to be returned.
+
+    Pool events only fire once a connection is handed out, so the wait is
+    measured by overriding ``QueuePool._do_get``, a private method. It is
+    stable across SQLAlchemy 2.0 and the version is pinned in pyproject.toml;
+    re-check this override when upgrading.
+    """
+
+    stats: PoolStats
+
+    def _do_get(self):
+        saturated = (
+            self._max_overflow > -1
+            and self.checkedin() == 0
+            and self.overflow() >= self._max_overflow
+        )
+        started = time.perf_counter()
+        try:
+            return super()._do_get()
+        except PoolTimeoutError:
+            self.stats.increment("timeouts")
+            raise
+        finally:
+            if saturated:
+                self.stats.record_wait(time.perf_counter() - started)
+
+
+sync_pool_stats = PoolStats()
+async_pool_stats = PoolStats()
+
+
+class InstrumentedQueuePool(_WaitTimingMixin, QueuePool):
+    stats = sync_pool_stats
+
+
+class InstrumentedAsyncQueuePool(_WaitTimingMixin, AsyncAdaptedQueuePool):
+    stats = async_pool_stats
+
+
+def _engine_options(url: str, poolclass) -> dict:
+    options = {"pool_pre_ping": settings.db_pool_pre_ping}
+    # SQLite picks its own single-connection pools; sizing does not apply
+    if not url.startswith("sqlite"):
+        options.update(
+            poolclass=poolclass,
+            pool_size=settings.db_pool_size,
+            max_overflow=settings.db_max_overflow,
+            pool_timeout=settings.db_pool_timeout,
+            pool_recycle=settings.db_pool_recycle,
+        )
+    return options
+
+
+def _instrument(sync_engine, stats: PoolStats) -> None:
+    @event.listens_for(sync_engine, "connect")
+    def _connect(dbapi_connection, connection_record):
+        stats.increment("connects")
+
+    @event.listens_for(sync_engine, "checkout")
+    def _checkout(dbapi_connection, connection_record, connection_proxy):
+        stats.increment("checkouts")
+        pool = sync_engine.pool
+        if isinstance(pool, QueuePool):
+            stats.record_overflow(pool.overflow())
+
+    @event.listens_for(sync_engine, "checkin")
+    def _checkin(dbapi_connection, connection_record):
+        stats.increment("checkins")
+
+    @event.listens_for(sync_engine, "invalidate")
+    def _invalidate(dbapi_connection, connection_record, exception):
+        stats.increment("invalidations")
+
+
 # SQLAlchemy engine
 engine = create_engine(
     settings.database_url,
-    pool_pre_ping=True,
+    **_engine_options(settings.database_url, InstrumentedQueuePool),
 )
+_instrument(engine, sync_pool_stats)
 
 # Session factory
 SessionLocal = sessionmaker(
@@ -15,6 +148,28 @@ SessionLocal = sessionmaker(
     bind=engine
 )
 
+
+def _async_database_url(url: str) -> str:
+    # postgresql+psycopg picks psycopg3's async driver on its own;
+    # SQLite (local runs) needs the aiosqlite driver spelled out.
+    if url.startswith("sqlite:"):
+        return "sqlite+aiosqlite:" + url[len("sqlite:"):]
+    return url
+
+
+# Async engine for latency-sensitive routes that must not block the event loop
+async_engine = create_async_engine(
+    _async_database_url(settings.database_url),
+    **_engine_options(settings.database_url, InstrumentedAsyncQueuePool),
+)
+_instrument(async_engine.sync_engine, async_pool_stats)
+
+AsyncSessionLocal = async_sessionmaker(
+    bind=async_engine,
+    autoflush=False,
+    expire_on_commit=False,
+)
+
 # Base class for ORM models
 Base = declarative_base()
 
@@ -29,3 +184,18 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+async def get_async_db() -> AsyncIterator[AsyncSession]:
+    """
+    Async counterpart of get_db for `async def` routes.
+    """
+    async with AsyncSessionLocal() as db:
+        yield db
+
+
+def pool_status() -> Dict[str, Dict[str, float]]:
+    return {
+        "sync": sync_pool_stats.snapshot(engine.pool),
+        "async": async_pool_stats.snapshot(async_engine.sync_engine.pool),
+    }
@@ -0,0 +1,117 @@
+"""Batched drill create / update / delete for the curator API.
+
+Items are grouped by the set of columns they carry and written with one
+``INSERT ... ON CONFLICT (id) DO UPDATE`` per group and chunk (through
+``importer.upsert_records``), so omitted columns keep their stored values.
+The stored name is filled in for partial updates because the NOT NULL check
+runs on the proposed row before the conflict is resolved.
+Items without an id are inserted with ``RETURNING id``. Tags are resynced per
+chunk and the drills cache version is bumped once per batch, with the
+affected ids so derived snapshots can refresh incrementally.
+"""
+
+from collections import Counter
+from typing import Dict, List, Mapping, Optional, Sequence, Tuple
+
+from sqlalchemy import delete, insert, select
+from sqlalchemy.orm import Session
+
+from backend.app.cache import catalog_cache
+from backend.app.importer import DRILL_IMPORT, sync_drill_tags, sync_id_sequence, upsert_records
+from backend.app.models import Drill, DrillTag
+
+BATCH_CHUNK_SIZE = 500
+
+
+def _chunks(records: Sequence[Dict], size: int):
+    for start in range(0, len(records), size):
+        yield records[start:start + size]
+
+
+def _grouped(records: Sequence[Dict]) -> List[List[Dict]]:
+    """Records split by column set; a multi-row statement needs uniform columns."""
+    groups: Dict[Tuple[str, ...], List[Dict]] = {}
+    for record in records:
+        groups.setdefault(tuple(sorted(record)), []).append(record)
+    return list(groups.values())
+
+
+def write_drills(
+    db: Session,
+    items: Sequence[Optional[Mapping[str, object]]],
+    delete_ids: Sequence[int],
+) -> Tuple[List[Dict[str, object]], List[Dict[str, object]]]:
+    """Apply upserts and deletes in one transaction; return per-item results.
+
+    ``items`` holds validated column dicts, or None for items that already
+    failed validation (their result is left to the caller).
+    """
+    upsert_results: List[Dict[str, object]] = [{} for _ in items]
+    delete_results: List[Dict[str, object]] = []
+
+    explicit_ids = [item["id"] for item in items if item is not None and item.get("id") is not None]
+    wanted = set(explicit_ids) | set(delete_ids)
+    existing: Dict[int, str] = (
+        dict(db.execute(select(Drill.id, Drill.name).where(Drill.id.in_(wanted))).all()) if wanted else {}
+    )
+
+    repeated = {drill_id for drill_id, count in Counter(explicit_ids).items() if count > 1}
+    with_id: List[Dict] = []
+    without_id: List[Tuple[int, Dict]] = []
+    for index, item in enumerate(items):
+        if item is None:
+            continue
+        drill_id = item.get("id")
+        if drill_id in repeated:
+            upsert_results[index] = {"id": drill_id, "status": "error", "error": "id repeated in batch"}
+        elif drill_id in delete_ids:
+            upsert_results[index] = {"id": drill_id, "status": "error", "error": "id also listed for deletion"}
+        elif drill_id not in existing and not item.get("name"):
+            upsert_results[index] = {"id": drill_id, "status": "error", "error": "name is required to create a drill"}
+        elif drill_id is None:
+            # An explicit null id must not reach the INSERT as a NULL primary key
+            without_id.append((index, {key: value for key, value in item.items() if key != "id"}))
+        else:
+            with_id.append({"name": existing.get(drill_id), **item})
+            upsert_results[index] = {"id": drill_id, "status": "updated" if drill_id in existing else "created"}
+
+    changed = set()
+    try:
+        for group in _grouped(with_id):
+            for chunk in _chunks(group, BATCH_CHUNK_SIZE):
+                upsert_records(db, DRILL_IMPORT, chunk)
+                changed.update(record["id"] for record in chunk)
+        if any(record["id"] not in existing for record in with_id):
+            sync_id_sequence(db, DRILL_IMPORT)
+
+        for group in _grouped([record for _, record in without_id]):
+            for chunk in _chunks(group, BATCH_CHUNK_SIZE):
+                stmt = insert(Drill.__table__).returning(Drill.__table__.c.id, sort_by_parameter_order=True)
+                ids = db.execute(stmt, chunk).scalars().all()
+                for record, drill_id in zip(chunk, ids):
+                    record["id"] = drill_id
+                sync_drill_tags(db, chunk)
+                changed.update(ids)
+        for index, record in without_id:
+            upsert_results[index] = {"id": record["id"], "status": "created"}
+
+        removable = [drill_id for drill_id in dict.fromkeys(delete_ids) if drill_id in existing]
+        for chunk in _chunks(removable, BATCH_CHUNK_SIZE):
+            # Explicit, as SQLite does not enforce the ON DELETE CASCADE
+            db.execute(delete(DrillTag).where(DrillTag.drill_id.in_(chunk)))
+            db.execute(delete(Drill).where(Drill.id.in_(chunk)))
+        changed.update(removable)
+        delete_results = [
+            {"id": drill_id, "status": "deleted" if drill_id in existing else "not_found"}
+            for drill_id in dict.fromkeys(delete_ids)
+        ]
+
+        db.commit()
+    except Exception:
+        db.rollback()
+        raise
+
+    if changed:
+        # Core statements bypass the ORM listeners; one bump covers the batch
+        catalog_cache.bump("drills", changed)
+    return upsert_results, delete_results
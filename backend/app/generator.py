@@ -0,0 +1,99 @@
+"""Training-session generator over the array-backed drill catalog."""
+
+from dataclasses import dataclass, field
+from typing import List, Optional, Sequence
+
+import numpy as np
+
+from backend.app.catalog import DrillCatalog
+
+# Weights of the per-drill score components
+FOCUS_WEIGHT = 2.0
+UNCOVERED_FOCUS_WEIGHT = 1.0
+INTENSITY_WEIGHT = 1.5
+
+
+@dataclass
+class PlanBlock:
+    drill_id: int
+    name: str
+    minutes: int
+    segment: int
+    intensity_type: str
+    skill_domains: List[str] = field(default_factory=list)
+
+
+def _split_budget(total: int, segments: int) -> List[int]:
+    base, extra = divmod(total, segments)
+    return [base + (1 if i < extra else 0) for i in range(segments)]
+
+
+def generate_plan(
+    catalog: DrillCatalog,
+    duration: int,
+    age: Optional[int] = None,
+    focus: Sequence[str] = (),
+    intensity_curve: Sequence[str] = (),
+    max_drills: int = 12,
+) -> List[PlanBlock]:
+    """Greedily fill ``duration`` minutes with drills.
+
+    The budget is split evenly across the ``intensity_curve`` segments. Each
+    pick is a single vectorized pass over the catalog scoring focus coverage
+    (with a bonus for focus domains not covered yet) and intensity match.
+    """
+    if len(catalog) == 0 or duration <= 0:
+        return []
+
+    focus_cols = catalog.domain_columns(tag.strip().lower() for tag in focus)
+    focus_matrix = catalog.domains[:, focus_cols].astype(np.float64)
+    focus_score = focus_matrix.sum(axis=1) / len(focus_cols) if focus_cols else np.zeros(len(catalog))
+
+    # Drills without a lower bound can be run for any positive length
+    min_minutes = np.nan_to_num(catalog.duration_min, nan=1.0)
+    max_minutes = np.where(np.isnan(catalog.duration_max), np.inf, catalog.duration_max)
+
+    # A drill capped below one minute would only add empty blocks
+    available = catalog.age_mask(age) & (max_minutes >= 1)
+    uncovered = np.ones(len(focus_cols), dtype=bool)
+
+    curve = [label.strip().lower() for label in intensity_curve] or [None]
+    plan: List[PlanBlock] = []
+
+    for segment, budget in enumerate(_split_budget(duration, len(curve))):
+        intensity_code = catalog.intensity_vocab.get(curve[segment]) if curve[segment] else None
+        intensity_score = (
+            (catalog.intensity == intensity_code) * INTENSITY_WEIGHT
+            if intensity_code is not None
+            else 0.0
+        )
+        remaining = budget
+
+        while remaining > 0 and len(plan) < max_drills:
+            candidates = available & (min_minutes <= remaining)
+            if not candidates.any():
+                break
+
+            score = focus_score * FOCUS_WEIGHT + intensity_score
+            if focus_cols and uncovered.any():
+                score = score + focus_matrix[:, uncovered].sum(axis=1) * UNCOVERED_FOCUS_WEIGHT
+            row = int(np.argmax(np.where(candidates, score, -np.inf)))
+
+            minutes = int(min(max_minutes[row], remaining))
+            available[row] = False
+            remaining -= minutes
+            if focus_cols:
+                uncovered &= ~catalog.domains[row, focus_cols]
+
+            plan.append(
+                PlanBlock(
+                    drill_id=int(catalog.ids[row]),
+                    name=catalog.names[row],
+                    minutes=minutes,
+                    segment=segment,
+                    intensity_type=catalog.intensity_labels[catalog.intensity[row]],
+                    skill_domains=catalog.tags_for(row),
+                )
+            )
+
+    return plan
@@ -0,0 +1,297 @@
+"""Chunked CSV import pipeline for drills and clubs.
+
+CSV input is read in ``chunk_size`` frames with pandas. Each frame is
+validated and coerced column-wise, diffed against the database with one
+keyed ``SELECT``, and (unless ``dry_run``) written with a single batched
+``INSERT ... ON CONFLICT DO UPDATE`` instead of the ORM unit of work.
+
+pandas is imported on first use, keeping it out of API startup.
+"""
+
+import time
+from dataclasses import asdict, dataclass, field
+from typing import TYPE_CHECKING, BinaryIO, Dict, Iterable, List, Mapping, Optional, Sequence, Tuple, Union
+
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.orm import Session
+
+from backend.app.cache import catalog_cache
+from backend.app.models import Club, Drill, DrillTag
+from backend.app.tags import TAG_COLUMNS, parse_tags
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+DEFAULT_CHUNK_SIZE = 2000
+MAX_REPORTED_ERRORS = 100
+
+# Row marker used when comparing nullable values between CSV and database
+_MISSING = "\x00"
+
+
+@dataclass(frozen=True)
+class ImportSpec:
+    model: type
+    key: str
+    namespace: str
+    # CSV header -> model column, for headers that differ from the column name
+    aliases: Mapping[str, str]
+    int_columns: Tuple[str, ...] = ()
+    required: Tuple[str, ...] = ()
+
+    @property
+    def columns(self) -> List[str]:
+        return [column.name for column in self.model.__table__.columns if column.name in self.importable]
+
+    @property
+    def importable(self) -> set:
+        excluded = {"created_at", "updated_at"}
+        if self.key != "id":
+            excluded.add("id")
+        return {column.name for column in self.model.__table__.columns} - excluded
+
+
+DRILL_IMPORT = ImportSpec(
+    model=Drill,
+    key="id",
+    namespace="drills",
+    aliases={
+        "skillFocus": "skill_focus",
+        "durationMin": "duration_min",
+        "durationMax": "duration_max",
+        "imageUrls": "image_urls",
+        "videoUrls": "video_urls",
+    },
+    int_columns=(
+        "id",
+        "duration_min",
+        "duration_max",
+        "complexity_level",
+        "decision_level",
+        "age_min",
+        "age_max",
+    ),
+    required=("id", "name"),
+)
+
+CLUB_IMPORT = ImportSpec(
+    model=Club,
+    key="name",
+    namespace="clubs",
+    aliases={},
+    required=("name",),
+)
+
+
+@dataclass
+class ImportReport:
+    dry_run: bool
+    rows_read: int = 0
+    created: int = 0
+    updated: int = 0
+    unchanged: int = 0
+    rejected: int = 0
+    errors: List[Dict[str, object]] = field(default_factory=list)
+    elapsed_seconds: float = 0.0
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows_read / self.elapsed_seconds if self.elapsed_seconds else 0.0
+
+    def summary(self) -> Dict[str, object]:
+        return {**asdict(self), "rows_per_second": round(self.rows_per_second, 1)}
+
+    def add_errors(self, errors: Iterable[Dict[str, object]]) -> None:
+        for error in errors:
+            self.rejected += 1
+            if len(self.errors) < MAX_REPORTED_ERRORS:
+                self.errors.append(error)
+
+
+def _prepare(frame: "pd.DataFrame", spec: ImportSpec) -> Tuple["pd.DataFrame", List[Dict[str, object]]]:
+    """Rename, trim and coerce one chunk; return valid rows and row errors."""
+    import pandas as pd
+
+    frame = frame.rename(columns=spec.aliases)
+    frame = frame[[column for column in spec.columns if column in frame.columns]]
+    # CSV line numbers: header is line 1
+    lines = frame.index.to_series() + 2
+
+    frame = frame.apply(lambda column: column.str.strip())
+    frame = frame.mask(frame == "")
+    invalid = pd.Series("", index=frame.index)
+
+    for column in spec.required:
+        if column not in frame.columns:
+            raise ValueError(f"Missing required column '{column}'")
+        invalid = invalid.mask(frame[column].isna() & (invalid == ""), f"{column} is required")
+
+    for column in spec.int_columns:
+        if column not in frame.columns:
+            continue
+        coerced = pd.to_numeric(frame[column], errors="coerce")
+        bad = frame[column].notna() & (coerced.isna() | (coerced % 1 != 0))
+        invalid = invalid.mask(bad & (invalid == ""), f"{column} is not an integer")
+        frame[column] = coerced.where(~bad).astype("Int64")
+
+    errors = [
+        {"line": int(lines[index]), "error": message}
+        for index, message in invalid[invalid != ""].items()
+    ]
+    frame = frame[invalid == ""]
+    # Later rows win when a key repeats inside the file
+    frame = frame.drop_duplicates(subset=[spec.key], keep="last")
+    return frame, errors
+
+
+def _records(frame: "pd.DataFrame") -> List[Dict[str, object]]:
+    return frame.astype(object).where(frame.notna(), None).to_dict("records")
+
+
+def _diff(db: Session, frame: "pd.DataFrame", spec: ImportSpec) -> Tuple["pd.Series", "pd.Series"]:
+    """Boolean masks (created, changed) of ``frame`` rows against stored rows."""
+    import pandas as pd
+
+    table = spec.model.__table__
+    columns = list(frame.columns)
+    keys = [key.item() if hasattr(key, "item") else key for key in frame[spec.key]]
+    stored = pd.DataFrame(
+        db.execute(select(*(table.c[name] for name in columns)).where(table.c[spec.key].in_(keys))).all(),
+        columns=columns,
+    )
+    for column in columns:
+        if column in spec.int_columns:
+            stored[column] = stored[column].astype("Int64")
+
+    merged = frame.merge(stored, on=spec.key, how="left", suffixes=("", "__stored"), indicator=True)
+    created = (merged["_merge"] == "left_only").to_numpy()
+
+    changed = pd.Series(False, index=merged.index)
+    for column in columns:
+        if column == spec.key:
+            continue
+        new = merged[column].astype(object).where(merged[column].notna(), _MISSING).astype(str)
+        old = merged[f"{column}__stored"].astype(object)
+        old = old.where(old.notna(), _MISSING).astype(str)
+        changed |= new != old
+    return pd.Series(created, index=frame.index), pd.Series(changed.to_numpy() & ~created, index=frame.index)
+
+
+def _insert(db: Session):
+    dialect = db.get_bind().dialect.name
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as dialect_insert
+    elif dialect == "sqlite":
+        from sqlalchemy.dialects.sqlite import insert as dialect_insert
+    else:
+        raise RuntimeError(f"Bulk upsert is not supported on {dialect}")
+    return dialect_insert
+
+
+def upsert_records(db: Session, spec: ImportSpec, records: Sequence[Mapping[str, object]]) -> None:
+    """Write ``records`` with one batched INSERT ... ON CONFLICT DO UPDATE."""
+    if not records:
+        return
+
+    table = spec.model.__table__
+    columns = list(records[0])
+    stmt = _insert(db)(table)
+    updates = {name: stmt.excluded[name] for name in columns if name != spec.key}
+    if "updated_at" in table.c:
+        updates["updated_at"] = func.now()
+    # With RETURNING, SQLAlchemy's "insertmanyvalues" batches the parameter
+    # list into multi-VALUES statements; without it the list runs as a
+    # driver executemany, one statement per row
+    stmt = stmt.on_conflict_do_update(index_elements=[spec.key], set_=updates).returning(table.c[spec.key])
+    db.execute(stmt, list(records)).all()
+
+    if spec.model is Drill:
+        sync_drill_tags(db, records)
+
+
+def sync_drill_tags(db: Session, records: Sequence[Mapping[str, object]]) -> None:
+    """Rebuild drill_tags for drills written outside the ORM."""
+    kinds = [kind for kind in TAG_COLUMNS if kind in records[0]]
+    if not kinds:
+        return
+
+    ids = [record["id"] for record in records]
+    db.execute(delete(DrillTag).where(DrillTag.drill_id.in_(ids), DrillTag.kind.in_(kinds)))
+    rows = [
+        {"drill_id": record["id"], "kind": kind, "tag": tag}
+        for record in records
+        for kind in kinds
+        for tag in parse_tags(record[kind])
+    ]
+    if rows:
+        db.execute(insert(DrillTag), rows)
+
+
+def sync_id_sequence(db: Session, spec: ImportSpec) -> None:
+    # Explicit ids do not advance the serial sequence on PostgreSQL
+    if spec.key == "id" and db.get_bind().dialect.name == "postgresql":
+        table = spec.model.__tablename__
+        db.execute(
+            text(f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), coalesce(max(id), 1)) FROM {table}")
+        )
+
+
+def import_csv(
+    db: Session,
+    source: Union[str, BinaryIO],
+    spec: ImportSpec,
+    dry_run: bool = True,
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    on_chunk=None,
+) -> ImportReport:
+    """Validate ``source`` chunk by chunk and, unless ``dry_run``, upsert it."""
+    import pandas as pd
+
+    report = ImportReport(dry_run=dry_run)
+    started = time.perf_counter()
+
+    reader = pd.read_csv(
+        source,
+        chunksize=chunk_size,
+        dtype=str,
+        keep_default_na=False,
+        encoding="utf-8",
+    )
+    try:
+        for chunk in reader:
+            report.rows_read += len(chunk)
+            frame, errors = _prepare(chunk, spec)
+            report.add_errors(errors)
+            if frame.empty:
+                continue
+
+            created, changed = _diff(db, frame, spec)
+            report.created += int(created.sum())
+            report.updated += int(changed.sum())
+            report.unchanged += int((~created & ~changed).sum())
+
+            if not dry_run:
+                upsert_records(db, spec, _records(frame[created | changed]))
+            if on_chunk is not None:
+                on_chunk(report)
+
+        if not dry_run and (report.created or report.updated):
+            sync_id_sequence(db, spec)
+            db.commit()
+            # Core statements bypass the ORM listeners that bump versions
+            catalog_cache.bump(spec.namespace)
+    except Exception:
+        db.rollback()
+        raise
+
+    report.elapsed_seconds = time.perf_counter() - started
+    return report
+
+
+def import_path(db: Session, path: str, spec: ImportSpec, dry_run: bool = True, **kwargs) -> ImportReport:
+    with open(path, "rb") as handle:
+        return import_csv(db, handle, spec, dry_run=dry_run, **kwargs)
+
+
+def spec_for(kind: str) -> Optional[ImportSpec]:
+    return {"drills": DRILL_IMPORT, "clubs": CLUB_IMPORT}.get(kind)
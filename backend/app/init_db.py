@@ -1,10 +1,20 @@
 from backend.app.seed.seed_clubs import seed_clubs
 from backend.app.seed.seed_drills import seed_drills
 from backend.app.models import User, UserRole
-from backend.app.database import SessionLocal
+from backend.app.database import SessionLocal, engine
 from backend.app.auth import get_password_hash
 import os
-from sqlalchemy import select
+import threading
+from contextlib import contextmanager
+from sqlalchemy import select, text
+
+# Set once background seeding has finished (successfully or not)
+seed_ready = threading.Event()
+# Set alongside seed_ready when background seeding raised
+seed_failed = threading.Event()
+
+# Arbitrary application-wide key for pg_advisory_lock
+SEED_LOCK_KEY = 7_305_001
 
 
 def seed_platform_admin() -> None:
@@ -36,8 +46,47 @@ def seed_platform_admin() -> None:
         session.close()
 
 
-def init_db() -> None:
-    seed_platform_admin()
-    seed_clubs()
-    seed_drills()
+@contextmanager
+def seed_lock():
+    """Serialize seeding across processes; later holders find the seed applied."""
+    if engine.dialect.name != "postgresql":
+        yield
+        return
+    with engine.connect() as conn:
+        conn.execute(text("SELECT pg_advisory_lock(:key)"), {"key": SEED_LOCK_KEY})
+        try:
+            yield
+        finally:
+            conn.execute(text("SELECT pg_advisory_unlock(:key)"), {"key": SEED_LOCK_KEY})
+            conn.commit()
+
+
+def init_db() -> bool:
+    with seed_lock():
+        seed_platform_admin()
+        seed_clubs()
+        seed_drills()
     print("✅ Seed completed.")
+    return True
+
+
+def start_background_seed() -> threading.Thread:
+    """Run init_db off the startup path; readiness is reported via seed_ready."""
+
+    def run() -> None:
+        try:
+            init_db()
+        except Exception as exc:  # keep serving; /health/ready reports the failure
+            seed_failed.set()
+            print("❌ Background seeding failed:", exc)
+        finally:
+            seed_ready.set()
+
+    thread = threading.Thread(target=run, name="seed-db", daemon=True)
+    thread.start()
+    return thread
+
+
+if __name__ == "__main__":
+    # Pre-start step for multi-worker deployments (SEED_ON_STARTUP=false)
+    init_db()
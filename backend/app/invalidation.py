@@ -0,0 +1,171 @@
+"""Cross-process propagation of in-process cache invalidations.
+
+With several uvicorn workers each process holds its own catalog cache,
+derived snapshots and principal cache. Whenever one of them is invalidated
+locally, a small JSON message is published; every other process applies the
+same invalidation on receipt.
+
+On PostgreSQL messages travel over ``LISTEN/NOTIFY`` on
+``Settings.cache_invalidation_channel``. Elsewhere (SQLite, single worker)
+``LocalBroadcaster`` stands in and nothing leaves the process. After a
+dropped listener connection every process resynchronises by invalidating
+everything, since notifications sent in the meantime are lost.
+"""
+
+import atexit
+import json
+import logging
+import os
+import queue
+import socket
+import threading
+import uuid
+from typing import Callable, Dict, List
+
+from sqlalchemy.engine import make_url
+
+from backend.app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+# NOTIFY payloads must stay below 8000 bytes
+MAX_PAYLOAD_BYTES = 7900
+LISTEN_POLL_SECONDS = 1.0
+RECONNECT_SECONDS = 5.0
+FLUSH_TIMEOUT_SECONDS = 2.0
+
+ORIGIN = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+
+Handler = Callable[[dict], None]
+_handlers: Dict[str, List[Handler]] = {}
+
+
+def register(kind: str, handler: Handler) -> None:
+    """Call ``handler(message)`` for messages of ``kind`` from other processes."""
+    _handlers.setdefault(kind, []).append(handler)
+
+
+def dispatch(message: dict) -> None:
+    for handler in _handlers.get(message.get("kind"), ()):
+        try:
+            handler(message)
+        except Exception:  # one bad handler must not stop the listener
+            logger.exception("Cache invalidation handler failed for %s", message)
+
+
+class LocalBroadcaster:
+    """Single-process stand-in: local invalidation already happened."""
+
+    name = "local"
+
+    def publish(self, kind: str, **fields) -> None:
+        pass
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+
+class PostgresBroadcaster:
+    name = "postgres"
+
+    def __init__(self, database_url: str, channel: str):
+        # psycopg wants a libpq URL, not the SQLAlchemy driver form
+        self.dsn = make_url(database_url).set(drivername="postgresql").render_as_string(hide_password=False)
+        self.channel = channel
+        self._outbox: "queue.Queue[str]" = queue.Queue()
+        self._stopped = threading.Event()
+        self._publisher = None
+        self._listener = None
+        self._lock = threading.Lock()
+
+    def _connect(self):
+        # Only Postgres deployments pay for importing the driver
+        import psycopg
+
+        return psycopg.connect(self.dsn, autocommit=True)
+
+    def publish(self, kind: str, **fields) -> None:
+        payload = json.dumps({"origin": ORIGIN, "kind": kind, **fields})
+        if len(payload.encode()) > MAX_PAYLOAD_BYTES:
+            # Too many keys: receivers fall back to a full invalidation
+            payload = json.dumps({"origin": ORIGIN, "kind": kind, **{**fields, "keys": None}})
+        self._outbox.put(payload)
+        with self._lock:
+            if self._publisher is None:
+                self._publisher = threading.Thread(target=self._publish_loop, name="cache-notify", daemon=True)
+                self._publisher.start()
+                atexit.register(self.flush)
+
+    def flush(self, timeout: float = FLUSH_TIMEOUT_SECONDS) -> None:
+        """Wait briefly for queued messages, e.g. before a CLI process exits."""
+        done = threading.Thread(target=self._outbox.join, daemon=True)
+        done.start()
+        done.join(timeout)
+
+    def _publish_loop(self) -> None:
+        conn = None
+        while True:
+            payload = self._outbox.get()
+            try:
+                for attempt in range(2):
+                    try:
+                        conn = conn or self._connect()
+                        conn.execute("SELECT pg_notify(%s, %s)", (self.channel, payload))
+                        break
+                    except Exception as exc:
+                        conn = None
+                        if attempt:
+                            logger.warning("Dropping cache invalidation message: %s", exc)
+            finally:
+                self._outbox.task_done()
+
+    def start(self) -> None:
+        if self._listener is None:
+            self._stopped.clear()
+            self._listener = threading.Thread(target=self._listen_loop, name="cache-listen", daemon=True)
+            self._listener.start()
+
+    def stop(self) -> None:
+        self._stopped.set()
+        self._listener = None
+
+    def _listen_loop(self) -> None:
+        from psycopg import sql
+
+        connected_before = False
+        while not self._stopped.is_set():
+            try:
+                with self._connect() as conn:
+                    conn.execute(sql.SQL("LISTEN {}").format(sql.Identifier(self.channel)))
+                    if connected_before:
+                        dispatch({"kind": "resync"})
+                    connected_before = True
+                    while not self._stopped.is_set():
+                        for notify in conn.notifies(timeout=LISTEN_POLL_SECONDS):
+                            self._receive(notify.payload)
+            except Exception as exc:
+                logger.warning("Cache invalidation listener disconnected: %s", exc)
+                self._stopped.wait(RECONNECT_SECONDS)
+
+    def _receive(self, payload: str) -> None:
+        try:
+            message = json.loads(payload)
+        except ValueError:
+            return
+        if message.get("origin") != ORIGIN:
+            dispatch(message)
+
+
+def _make_broadcaster():
+    mode = settings.cache_invalidation
+    if mode == "auto":
+        mode = "postgres" if make_url(settings.database_url).get_backend_name() == "postgresql" else "local"
+    if mode == "postgres":
+        return PostgresBroadcaster(settings.database_url, settings.cache_invalidation_channel)
+    return LocalBroadcaster()
+
+
+broadcaster = _make_broadcaster()
@@ -1,14 +1,37 @@
 from fastapi import FastAPI
-from backend.app.routers import auth, users, clubs, drills
-from backend.app.init_db import init_db
+from fastapi.responses import ORJSONResponse
+from backend.app.routers import auth, users, clubs, drills, health, metrics, training
+from backend.app.init_db import seed_ready, start_background_seed
+from backend.app.invalidation import broadcaster
+from backend.app.media import MEDIA_URL_PREFIX, MediaFiles, ensure_storage
+from backend.app.metrics import MetricsMiddleware
+from backend.app.settings import settings
 
-app = FastAPI(title="Volley Platform API")
+app = FastAPI(title="Volley Platform API", default_response_class=ORJSONResponse)
+app.add_middleware(MetricsMiddleware)
 
 @app.on_event("startup")
 def on_startup():
-    init_db()
+    ensure_storage()
+    broadcaster.start()
+    if settings.seed_on_startup:
+        start_background_seed()
+    else:
+        seed_ready.set()
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    broadcaster.stop()
 
 app.include_router(auth, prefix="/auth", tags=["Auth"])
 app.include_router(users, prefix="/users", tags=["Users"])
 app.include_router(clubs, prefix="/clubs", tags=["Clubs"])
 app.include_router(drills, prefix="/drills", tags=["Drills"])
+app.include_router(training, prefix="/training", tags=["Training"])
+app.include_router(health, prefix="/health", tags=["Health"])
+app.include_router(metrics, tags=["Metrics"])
+
+# Range / ETag / If-None-Match aware file serving for uploaded drill media;
+# the startup hook creates the directory
+app.mount(MEDIA_URL_PREFIX, MediaFiles(directory=settings.storage_path, check_dir=False), name="media")
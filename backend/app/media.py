@@ -0,0 +1,152 @@
+"""Drill media stored on local disk under ``Settings.storage_path``.
+
+Uploads are streamed to a temporary file chunk by chunk and renamed into
+place, so request size never translates into memory use; each upload gets
+its own temporary file in a staging directory next to the storage root
+(outside the public mount), so partial files are never served and
+concurrent uploads of one name cannot mix. Image thumbnails
+are produced on a dedicated single-thread worker after the upload returns
+(only when Pillow is installed).
+
+Files are served by the ``/media`` mount (``MediaFiles``), which handles
+``Range``, ``ETag`` and ``If-None-Match``. uvicorn has no zero-copy path
+(it does not implement ASGI ``pathsend``), so by default bodies are read in
+chunks in Python. With ``Settings.media_sendfile`` the app only resolves the
+path and answers with ``X-Accel-Redirect`` or ``X-Sendfile``, and the
+fronting proxy sends the file itself with ``sendfile()``.
+"""
+
+import importlib.util
+import mimetypes
+import os
+import re
+import tempfile
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import AsyncIterator, Optional
+from urllib.parse import quote
+
+import anyio
+from starlette.responses import Response
+from starlette.staticfiles import StaticFiles
+
+from backend.app.settings import settings
+
+# Optional: thumbnails are skipped without Pillow. Only probe for it here;
+# the import itself waits for the first thumbnail so startup stays light.
+HAS_PILLOW = importlib.util.find_spec("PIL") is not None
+
+MEDIA_URL_PREFIX = "/media"
+THUMBNAIL_SIZE = (320, 320)
+THUMBNAIL_SUFFIX = ".thumb.jpg"
+
+IMAGE_EXTENSIONS = {".jpg", ".jpeg", ".png", ".webp", ".gif"}
+VIDEO_EXTENSIONS = {".mp4", ".webm", ".mov", ".m4v"}
+
+_UNSAFE_CHARS = re.compile(r"[^A-Za-z0-9._-]")
+
+_thumbnail_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="thumbnails")
+
+
+class MediaTooLarge(Exception):
+    pass
+
+
+class MediaFiles(StaticFiles):
+    """Static media that a fronting proxy can send with ``sendfile()``."""
+
+    def file_response(self, full_path, stat_result, scope, status_code: int = 200) -> Response:
+        if settings.media_sendfile == "none":
+            return super().file_response(full_path, stat_result, scope, status_code)
+
+        path = Path(full_path).resolve()
+        if settings.media_sendfile == "x-sendfile":
+            header = ("X-Sendfile", str(path))
+        else:
+            internal = f"{settings.media_internal_prefix.rstrip('/')}/{path.relative_to(storage_root()).as_posix()}"
+            header = ("X-Accel-Redirect", quote(internal))
+        # The proxy fills in the body, length, validators and Range handling
+        media_type = mimetypes.guess_type(path.name)[0] or "application/octet-stream"
+        return Response(status_code=status_code, media_type=media_type, headers=dict([header]))
+
+
+def storage_root() -> Path:
+    return Path(settings.storage_path).resolve()
+
+
+def staging_root() -> Path:
+    # A sibling of the storage root: outside /media, on the same filesystem for os.replace
+    root = storage_root()
+    return root.with_name(root.name + ".uploads")
+
+
+def ensure_storage() -> None:
+    storage_root().mkdir(parents=True, exist_ok=True)
+    staging_root().mkdir(parents=True, exist_ok=True)
+
+
+def safe_filename(filename: str) -> Optional[str]:
+    """Flatten ``filename`` to a safe basename, or None if nothing usable is left."""
+    name = _UNSAFE_CHARS.sub("_", Path(filename).name).lstrip(".")
+    return name or None
+
+
+def media_kind(filename: str) -> Optional[str]:
+    suffix = Path(filename).suffix.lower()
+    if suffix in IMAGE_EXTENSIONS:
+        return "image"
+    if suffix in VIDEO_EXTENSIONS:
+        return "video"
+    return None
+
+
+def drill_media_path(drill_id: int, filename: str) -> Path:
+    return storage_root() / "drills" / str(drill_id) / filename
+
+
+def media_url(path: Path) -> str:
+    return f"{MEDIA_URL_PREFIX}/{path.relative_to(storage_root()).as_posix()}"
+
+
+async def save_stream(chunks: AsyncIterator[bytes], destination: Path, max_bytes: int) -> int:
+    """Write ``chunks`` to ``destination`` atomically; return the byte count."""
+    destination.parent.mkdir(parents=True, exist_ok=True)
+    staging_root().mkdir(parents=True, exist_ok=True)
+    handle_fd, partial_name = tempfile.mkstemp(dir=staging_root(), prefix=destination.name + ".", suffix=".part")
+    os.close(handle_fd)
+    partial = Path(partial_name)
+    written = 0
+    try:
+        async with await anyio.open_file(partial, "wb") as handle:
+            async for chunk in chunks:
+                written += len(chunk)
+                if written > max_bytes:
+                    raise MediaTooLarge(f"Upload exceeds {max_bytes} bytes")
+                await handle.write(chunk)
+        os.replace(partial, destination)
+    finally:
+        if partial.exists():
+            partial.unlink()
+    return written
+
+
+def thumbnail_path(path: Path) -> Path:
+    return path.with_name(path.stem + THUMBNAIL_SUFFIX)
+
+
+def _make_thumbnail(path: Path) -> None:
+    from PIL import Image
+
+    try:
+        with Image.open(path) as image:
+            image.thumbnail(THUMBNAIL_SIZE)
+            image.convert("RGB").save(thumbnail_path(path), "JPEG", quality=80)
+    except Exception as exc:  # a bad image must not take the worker down
+        print(f"⚠️ Thumbnail failed for {path.name}:", exc)
+
+
+def schedule_thumbnail(path: Path) -> bool:
+    if not HAS_PILLOW or media_kind(path.name) != "image":
+        return False
+    _thumbnail_executor.submit(_make_thumbnail, path)
+    return True
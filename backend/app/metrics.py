@@ -0,0 +1,212 @@
+"""Per-route latency histograms, per-request SQL counting and Prometheus output.
+
+``MetricsMiddleware`` times every request, up to the last byte of its body
+so streamed exports are measured in full, and labels it with the matched
+route template (``/drills/{drill_id}``, not the concrete path). SQLAlchemy
+cursor events on both engines add each statement's count and duration to
+the request currently being served, tracked through a context variable.
+Requests issuing more than ``Settings.n_plus_one_query_threshold``
+statements are logged as likely N+1 patterns.
+"""
+
+import logging
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from sqlalchemy import event
+from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+
+from backend.app.database import async_engine, engine
+from backend.app.settings import settings
+
+logger = logging.getLogger(__name__)
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100)
+
+
+class Histogram:
+    def __init__(self, buckets: Iterable[float]):
+        self.buckets = tuple(buckets)
+        self.counts = [0] * len(self.buckets)
+        self.total = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        self.total += 1
+        self.sum += value
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[i] += 1
+                break
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        running, result = 0, []
+        for bound, count in zip(self.buckets, self.counts):
+            running += count
+            result.append((bound, running))
+        return result
+
+
+@dataclass
+class RequestStats:
+    queries: int = 0
+    db_seconds: float = 0.0
+
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request", default=None)
+
+RouteKey = Tuple[str, str]
+
+_lock = threading.Lock()
+_latency: Dict[RouteKey, Histogram] = {}
+_queries: Dict[RouteKey, Histogram] = {}
+_db_seconds: Dict[RouteKey, float] = {}
+_responses: Dict[Tuple[str, str, int], int] = {}
+_n_plus_one: Dict[RouteKey, int] = {}
+
+
+def _record(method: str, route: str, status: int, seconds: float, stats: RequestStats) -> None:
+    key = (method, route)
+    with _lock:
+        _latency.setdefault(key, Histogram(LATENCY_BUCKETS)).observe(seconds)
+        _queries.setdefault(key, Histogram(QUERY_COUNT_BUCKETS)).observe(stats.queries)
+        _db_seconds[key] = _db_seconds.get(key, 0.0) + stats.db_seconds
+        _responses[(method, route, status)] = _responses.get((method, route, status), 0) + 1
+        if stats.queries > settings.n_plus_one_query_threshold:
+            _n_plus_one[key] = _n_plus_one.get(key, 0) + 1
+
+
+def _finish(request: Request, status: int, started: float, stats: RequestStats) -> None:
+    elapsed = time.perf_counter() - started
+    route = request.scope.get("route")
+    template = getattr(route, "path", None) or "unmatched"
+    _record(request.method, template, status, elapsed, stats)
+
+    if stats.queries > settings.n_plus_one_query_threshold:
+        logger.warning(
+            "Possible N+1: %s %s ran %d queries (%.1f ms in DB, %.1f ms total)",
+            request.method,
+            template,
+            stats.queries,
+            stats.db_seconds * 1000,
+            elapsed * 1000,
+        )
+
+
+class MetricsMiddleware(BaseHTTPMiddleware):
+    async def dispatch(self, request: Request, call_next):
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        started = time.perf_counter()
+        try:
+            response = await call_next(request)
+        except Exception:
+            _finish(request, 500, started, stats)
+            raise
+        finally:
+            # The endpoint task holds its own copy of the context, so queries
+            # issued while the body streams still reach ``stats``
+            _current_request.reset(token)
+
+        body = response.body_iterator
+
+        async def recorded_body():
+            # Streaming routes (exports) do most of their work after the
+            # headers are sent; record once the body is complete or aborted
+            try:
+                async for chunk in body:
+                    yield chunk
+            finally:
+                _finish(request, response.status_code, started, stats)
+
+        response.body_iterator = recorded_body()
+        return response
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    # Statements on one connection never overlap, so a single slot suffices
+    conn.info["query_started"] = time.perf_counter()
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    started = conn.info.pop("query_started", None)
+    stats = _current_request.get()
+    if stats is not None and started is not None:
+        stats.queries += 1
+        stats.db_seconds += time.perf_counter() - started
+
+
+for _engine in (engine, async_engine.sync_engine):
+    event.listen(_engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(_engine, "after_cursor_execute", _after_cursor_execute)
+
+
+def _labels(**labels) -> str:
+    parts = []
+    for name, value in labels.items():
+        escaped = str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+        parts.append(f'{name}="{escaped}"')
+    return "{" + ",".join(parts) + "}"
+
+
+def _histogram_lines(name: str, histograms: Dict[RouteKey, Histogram]) -> List[str]:
+    lines = [f"# TYPE {name} histogram"]
+    for (method, route), histogram in sorted(histograms.items()):
+        for bound, count in histogram.cumulative():
+            lines.append(f"{name}_bucket{_labels(method=method, route=route, le=bound)} {count}")
+        lines.append(f"{name}_bucket{_labels(method=method, route=route, le='+Inf')} {histogram.total}")
+        lines.append(f"{name}_sum{_labels(method=method, route=route)} {histogram.sum}")
+        lines.append(f"{name}_count{_labels(method=method, route=route)} {histogram.total}")
+    return lines
+
+
+def _series_lines(name: str, values: Dict[str, Dict[str, float]], label: str, kind: str = "gauge") -> List[str]:
+    """One ``name_<field>`` series per field, labelled by ``label``; counters get ``_total``."""
+    fields = sorted({field for series in values.values() for field in series})
+    suffix = "_total" if kind == "counter" else ""
+    lines = []
+    for field in fields:
+        metric = f"{name}_{field}{suffix}"
+        lines.append(f"# TYPE {metric} {kind}")
+        for label_value, series in sorted(values.items()):
+            if field in series:
+                lines.append(f"{metric}{_labels(**{label: label_value})} {series[field]}")
+    return lines
+
+
+ExtraSeries = Dict[str, Tuple[str, Dict[str, Dict[str, float]]]]
+
+
+def render_prometheus(extra_gauges: ExtraSeries = None, extra_counters: ExtraSeries = None) -> str:
+    """Prometheus text exposition of request metrics plus ``extra_gauges`` and ``extra_counters``.
+
+    Both map a metric prefix to ``(label_name, {label_value: {field: value}})``;
+    counter fields must only ever increase.
+    """
+    with _lock:
+        lines = _histogram_lines("http_request_duration_seconds", _latency)
+        lines += _histogram_lines("http_request_db_queries", _queries)
+
+        lines.append("# TYPE http_request_db_seconds_total counter")
+        for (method, route), seconds in sorted(_db_seconds.items()):
+            lines.append(f"http_request_db_seconds_total{_labels(method=method, route=route)} {seconds}")
+
+        lines.append("# TYPE http_requests_total counter")
+        for (method, route, status), count in sorted(_responses.items()):
+            lines.append(f"http_requests_total{_labels(method=method, route=route, status=status)} {count}")
+
+        lines.append("# TYPE http_requests_n_plus_one_total counter")
+        for (method, route), count in sorted(_n_plus_one.items()):
+            lines.append(f"http_requests_n_plus_one_total{_labels(method=method, route=route)} {count}")
+
+    for prefix, (label, values) in (extra_gauges or {}).items():
+        lines += _series_lines(prefix, values, label)
+    for prefix, (label, values) in (extra_counters or {}).items():
+        lines += _series_lines(prefix, values, label, kind="counter")
+
+    return "\n".join(lines) + "\n"
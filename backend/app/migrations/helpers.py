@@ -0,0 +1,70 @@
+"""Helpers for migrations that must not block reads on large tables.
+
+On PostgreSQL indexes are built with ``CREATE INDEX CONCURRENTLY``, which
+cannot run inside a transaction, so the helpers step out of Alembic's
+migration transaction with ``autocommit_block()``. Everything the migration
+did before that point is committed there: call these helpers last, and keep
+what they do repeatable (``IF [NOT] EXISTS``). Other dialects fall back to
+the plain, transactional operations.
+"""
+
+from typing import Callable, List, Mapping, Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def _is_postgres() -> bool:
+    return op.get_bind().dialect.name == "postgresql"
+
+
+def create_index_concurrently(name: str, table: str, columns: Sequence[str], **kwargs) -> None:
+    if not _is_postgres():
+        op.create_index(name, table, columns, **kwargs)
+        return
+    with op.get_context().autocommit_block():
+        op.create_index(name, table, columns, postgresql_concurrently=True, if_not_exists=True, **kwargs)
+
+
+def drop_index_concurrently(name: str, table: str) -> None:
+    if not _is_postgres():
+        op.drop_index(name, table_name=table)
+        return
+    with op.get_context().autocommit_block():
+        op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+
+def backfill_in_batches(
+    source: sa.TableClause,
+    key: str,
+    write: Callable[[sa.engine.Connection, List[Mapping]], None],
+    batch_size: int = BACKFILL_BATCH_SIZE,
+) -> int:
+    """Feed ``source`` rows to ``write(bind, rows)`` in keyset-ordered batches.
+
+    On PostgreSQL every statement commits on its own, so a large backfill
+    holds row locks for one batch at a time instead of the whole migration.
+    Returns the number of source rows read.
+    """
+
+    def run() -> int:
+        bind = op.get_bind()
+        column = source.c[key]
+        last, total = None, 0
+        while True:
+            stmt = sa.select(source).order_by(column).limit(batch_size)
+            if last is not None:
+                stmt = stmt.where(column > last)
+            rows = bind.execute(stmt).mappings().all()
+            if not rows:
+                return total
+            write(bind, rows)
+            total += len(rows)
+            last = rows[-1][key]
+
+    if not _is_postgres():
+        return run()
+    with op.get_context().autocommit_block():
+        return run()
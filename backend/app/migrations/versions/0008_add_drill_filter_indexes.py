@@ -0,0 +1,31 @@
+"""Add composite indexes backing the filtered /drills listing"""
+
+from backend.app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = "0008_add_drill_filter_indexes"
+down_revision = "0007_extend_clubs_table"
+branch_labels = None
+depends_on = None
+
+
+INDEXES = {
+    "ix_drills_category_id": ["category", "id"],
+    "ix_drills_level_id": ["level", "id"],
+    "ix_drills_complexity_level_id": ["complexity_level", "id"],
+    "ix_drills_decision_level_id": ["decision_level", "id"],
+    "ix_drills_intensity_type_id": ["intensity_type", "id"],
+    "ix_drills_type_of_drill_id": ["type_of_drill", "id"],
+    "ix_drills_age_range": ["age_min", "age_max"],
+    "ix_drills_duration_range": ["duration_min", "duration_max"],
+}
+
+
+def upgrade() -> None:
+    for name, columns in INDEXES.items():
+        create_index_concurrently(name, "drills", columns)
+
+
+def downgrade() -> None:
+    for name in INDEXES:
+        drop_index_concurrently(name, "drills")
@@ -0,0 +1,79 @@
+"""Create normalized drill_tags table and backfill it from packed drill columns"""
+
+import re
+
+import sqlalchemy as sa
+from alembic import op
+from sqlalchemy.dialects import postgresql, sqlite
+
+from backend.app.migrations.helpers import backfill_in_batches
+
+# revision identifiers, used by Alembic.
+revision = "0009_create_drill_tags_table"
+down_revision = "0008_add_drill_filter_indexes"
+branch_labels = None
+depends_on = None
+
+
+TAG_COLUMNS = (
+    "skill_domains",
+    "game_phases",
+    "tactical_focus",
+    "technical_focus",
+    "position_focus",
+    "zone_focus",
+)
+BATCH_SIZE = 1000
+
+
+def _parse(value):
+    tags = []
+    for part in re.split(r"[;,]", value or ""):
+        tag = part.strip().lower()[:100]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def _insert_ignoring_duplicates(bind, table):
+    dialect = postgresql if bind.dialect.name == "postgresql" else sqlite
+    return dialect.insert(table).on_conflict_do_nothing()
+
+
+def upgrade() -> None:
+    # The backfill commits batch by batch on PostgreSQL, so a failed run can
+    # leave the table and part of its rows behind: every step below skips
+    # what an earlier attempt already did.
+    drill_tags = op.create_table(
+        "drill_tags",
+        sa.Column(
+            "drill_id",
+            sa.Integer(),
+            sa.ForeignKey("drills.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("kind", sa.String(length=32), primary_key=True),
+        sa.Column("tag", sa.String(length=100), primary_key=True),
+        if_not_exists=True,
+    )
+    op.create_index("ix_drill_tags_tag_kind", "drill_tags", ["tag", "kind", "drill_id"], if_not_exists=True)
+
+    # Backfill from the packed columns of already-seeded drills
+    drills = sa.table("drills", sa.column("id"), *(sa.column(name) for name in TAG_COLUMNS))
+
+    def write(bind, batch):
+        rows = [
+            {"drill_id": drill["id"], "kind": kind, "tag": tag}
+            for drill in batch
+            for kind in TAG_COLUMNS
+            for tag in _parse(drill[kind])
+        ]
+        if rows:
+            bind.execute(_insert_ignoring_duplicates(bind, drill_tags), rows)
+
+    backfill_in_batches(drills, "id", write, batch_size=BATCH_SIZE)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_drill_tags_tag_kind", table_name="drill_tags")
+    op.drop_table("drill_tags")
@@ -0,0 +1,44 @@
+"""Add weighted tsvector search column with GIN index to drills (PostgreSQL only)"""
+
+from alembic import op
+
+from backend.app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = "0010_add_drill_search_vector"
+down_revision = "0009_create_drill_tags_table"
+branch_labels = None
+depends_on = None
+
+
+# Weights mirror backend.app.search.FIELD_WEIGHTS
+SEARCH_VECTOR = """
+    setweight(to_tsvector('simple', coalesce(name, '')), 'A') ||
+    setweight(to_tsvector('simple', coalesce(skill_focus, '') || ' ' || coalesce(goal, '')), 'B') ||
+    setweight(to_tsvector('simple', coalesce(description, '') || ' ' || coalesce(variations, '')), 'C')
+"""
+
+
+def upgrade() -> None:
+    # SQLite and other local databases use the in-memory BM25 fallback
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    op.execute(
+        f"ALTER TABLE drills ADD COLUMN search_vector tsvector "
+        f"GENERATED ALWAYS AS ({SEARCH_VECTOR}) STORED"
+    )
+    create_index_concurrently(
+        "ix_drills_search_vector",
+        "drills",
+        ["search_vector"],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    drop_index_concurrently("ix_drills_search_vector", "drills")
+    op.drop_column("drills", "search_vector")
@@ -0,0 +1,17 @@
+"""Index users.club_id for roster lookups and member counts"""
+
+from backend.app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = "0013_add_users_club_id_index"
+down_revision = "0012_create_refresh_tokens_table"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    create_index_concurrently("ix_users_club_id", "users", ["club_id"])
+
+
+def downgrade() -> None:
+    drop_index_concurrently("ix_users_club_id", "users")
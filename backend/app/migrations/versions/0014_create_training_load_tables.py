@@ -0,0 +1,83 @@
+"""Create athletes, training_sessions, athlete_loads and daily_loads tables"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0014_create_training_load_tables"
+down_revision = "0013_add_users_club_id_index"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "athletes",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("club_id", sa.Integer(), sa.ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("name", sa.String(length=255), nullable=False),
+        sa.Column("team", sa.String(length=100), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index("ix_athletes_club_id", "athletes", ["club_id"])
+
+    op.create_table(
+        "training_sessions",
+        sa.Column("id", sa.Integer(), primary_key=True),
+        sa.Column("club_id", sa.Integer(), sa.ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("coach_id", sa.Integer(), sa.ForeignKey("users.id", ondelete="SET NULL"), nullable=True),
+        sa.Column("team", sa.String(length=100), nullable=True),
+        sa.Column("date", sa.Date(), nullable=False),
+        sa.Column("duration_minutes", sa.Integer(), nullable=False),
+        sa.Column("rpe", sa.Integer(), nullable=True),
+        sa.Column("notes", sa.String(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.func.now(), nullable=True),
+    )
+    op.create_index("ix_training_sessions_club_id_date", "training_sessions", ["club_id", "date"])
+
+    op.create_table(
+        "athlete_loads",
+        sa.Column(
+            "session_id",
+            sa.Integer(),
+            sa.ForeignKey("training_sessions.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column(
+            "athlete_id",
+            sa.Integer(),
+            sa.ForeignKey("athletes.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("rpe", sa.Integer(), nullable=False),
+        sa.Column("duration_minutes", sa.Integer(), nullable=False),
+        sa.Column("load", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_athlete_loads_athlete_id", "athlete_loads", ["athlete_id"])
+
+    op.create_table(
+        "daily_loads",
+        sa.Column(
+            "athlete_id",
+            sa.Integer(),
+            sa.ForeignKey("athletes.id", ondelete="CASCADE"),
+            primary_key=True,
+        ),
+        sa.Column("date", sa.Date(), primary_key=True),
+        sa.Column("club_id", sa.Integer(), sa.ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False),
+        sa.Column("load", sa.Integer(), nullable=False),
+        sa.Column("minutes", sa.Integer(), nullable=False),
+        sa.Column("sessions", sa.Integer(), nullable=False),
+    )
+    op.create_index("ix_daily_loads_club_id_date", "daily_loads", ["club_id", "date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_daily_loads_club_id_date", table_name="daily_loads")
+    op.drop_table("daily_loads")
+    op.drop_index("ix_athlete_loads_athlete_id", table_name="athlete_loads")
+    op.drop_table("athlete_loads")
+    op.drop_index("ix_training_sessions_club_id_date", table_name="training_sessions")
+    op.drop_table("training_sessions")
+    op.drop_index("ix_athletes_club_id", table_name="athletes")
+    op.drop_table("athletes")
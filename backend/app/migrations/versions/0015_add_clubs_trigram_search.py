@@ -0,0 +1,57 @@
+"""Add pg_trgm search over transliterated club name and city (PostgreSQL only)"""
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = "0015_add_clubs_trigram_search"
+down_revision = "0014_create_training_load_tables"
+branch_labels = None
+depends_on = None
+
+
+# Mirrors backend.app.suggest.CYRILLIC_TO_LATIN; multi-letter mappings first
+DIGRAPHS = [("щ", "sht"), ("ж", "zh"), ("ц", "ts"), ("ч", "ch"), ("ш", "sh"), ("ю", "yu"), ("я", "ya")]
+LETTERS = ("абвгдезийклмнопрстуфхъь", "abvgdeziyklmnoprstufhay")
+
+
+def _search_text_sql() -> str:
+    expr = "lower(coalesce(name, '') || ' ' || coalesce(city, ''))"
+    for cyrillic, latin in DIGRAPHS:
+        expr = f"replace({expr}, '{cyrillic}', '{latin}')"
+    return f"translate({expr}, '{LETTERS[0]}', '{LETTERS[1]}')"
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    # SQLite and other local databases use the in-memory suggest index
+    if bind.dialect.name != "postgresql":
+        return
+    available = bind.execute(
+        sa.text("SELECT 1 FROM pg_available_extensions WHERE name = 'pg_trgm'")
+    ).scalar()
+    if not available:
+        print("⚠️ pg_trgm is not available; /clubs/suggest keeps the in-memory index.")
+        return
+
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute(
+        "CREATE OR REPLACE FUNCTION club_search_text(name text, city text) RETURNS text "
+        f"LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ SELECT {_search_text_sql()} $$"
+    )
+    create_index_concurrently(
+        "ix_clubs_search_trgm",
+        "clubs",
+        [sa.text("club_search_text(name, city) gin_trgm_ops")],
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+
+    drop_index_concurrently("ix_clubs_search_trgm", "clubs")
+    op.execute("DROP FUNCTION IF EXISTS club_search_text(text, text)")
@@ -0,0 +1,29 @@
+"""Create rate_limit_buckets table for shared login rate limiting"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "0016_create_rate_limit_buckets_table"
+down_revision = "0015_add_clubs_trigram_search"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # Buckets are disposable; skipping the WAL keeps each login check cheap
+    unlogged = ["UNLOGGED"] if op.get_bind().dialect.name == "postgresql" else []
+    op.create_table(
+        "rate_limit_buckets",
+        sa.Column("key", sa.String(length=400), primary_key=True),
+        sa.Column("tokens", sa.Float(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("allowed", sa.Boolean(), nullable=False),
+        prefixes=unlogged,
+    )
+    op.create_index("ix_rate_limit_buckets_updated_at", "rate_limit_buckets", ["updated_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_rate_limit_buckets_updated_at", table_name="rate_limit_buckets")
+    op.drop_table("rate_limit_buckets")
@@ -0,0 +1,85 @@
+"""Fold case explicitly in club_search_text() and add informal romanizations (PostgreSQL only)"""
+
+import string
+
+import sqlalchemy as sa
+from alembic import op
+
+from backend.app.migrations.helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision = "0017_fold_case_in_club_search_text"
+down_revision = "0016_create_rate_limit_buckets_table"
+branch_labels = None
+depends_on = None
+
+
+# Mirrors backend.app.suggest.CYRILLIC_TO_LATIN
+OFFICIAL = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ж": "zh", "з": "z",
+    "и": "i", "й": "y", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p",
+    "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "h", "ц": "ts", "ч": "ch",
+    "ш": "sh", "щ": "sht", "ъ": "a", "ь": "y", "ю": "yu", "я": "ya",
+}
+# The informal spellings of backend.app.suggest.ROMANIZATION_VARIANTS
+INFORMAL = {**OFFICIAL, "ц": "c", "я": "ia", "ю": "iu", "ъ": "u", "й": "i", "х": "kh"}
+
+# lower() follows the database ctype and leaves Cyrillic alone under C/POSIX,
+# so case is folded with an explicit map instead
+UPPER = "".join(letter.upper() for letter in OFFICIAL) + string.ascii_uppercase
+LOWER = "".join(OFFICIAL) + string.ascii_lowercase
+
+
+def _romanize(expr: str, mapping) -> str:
+    # Multi-letter mappings first, then one translate() for the rest
+    for cyrillic, latin in mapping.items():
+        if len(latin) > 1:
+            expr = f"replace({expr}, '{cyrillic}', '{latin}')"
+    single = [(cyrillic, latin) for cyrillic, latin in mapping.items() if len(latin) == 1]
+    return f"translate({expr}, '{''.join(c for c, _ in single)}', '{''.join(l for _, l in single)}')"
+
+
+def _create_function(body: str) -> None:
+    op.execute(
+        "CREATE OR REPLACE FUNCTION club_search_text(name text, city text) RETURNS text "
+        f"LANGUAGE sql IMMUTABLE PARALLEL SAFE AS $$ {body} $$"
+    )
+
+
+def _function_exists() -> bool:
+    # Migration 0015 skips the function where pg_trgm is unavailable
+    bind = op.get_bind()
+    if bind.dialect.name != "postgresql":
+        return False
+    return bool(bind.execute(sa.text("SELECT to_regprocedure('club_search_text(text, text)') IS NOT NULL")).scalar())
+
+
+def _rebuild(body: str) -> None:
+    # The index stores computed values, so it must not outlive the old
+    # definition: drop it, swap the function, then build it again
+    drop_index_concurrently("ix_clubs_search_trgm", "clubs")
+    _create_function(body)
+    create_index_concurrently(
+        "ix_clubs_search_trgm",
+        "clubs",
+        [sa.text("club_search_text(name, city) gin_trgm_ops")],
+        postgresql_using="gin",
+    )
+
+
+def upgrade() -> None:
+    if not _function_exists():
+        return
+    folded = f"translate(coalesce(name, '') || ' ' || coalesce(city, ''), '{UPPER}', '{LOWER}')"
+    spellings = " || ' ' || ".join(_romanize("t.folded", mapping) for mapping in (OFFICIAL, INFORMAL))
+    _rebuild(f"SELECT {spellings} FROM (SELECT {folded} AS folded) AS t")
+
+
+def downgrade() -> None:
+    if not _function_exists():
+        return
+    # Definition from migration 0015
+    expr = "lower(coalesce(name, '') || ' ' || coalesce(city, ''))"
+    for cyrillic, latin in (("щ", "sht"), ("ж", "zh"), ("ц", "ts"), ("ч", "ch"), ("ш", "sh"), ("ю", "yu"), ("я", "ya")):
+        expr = f"replace({expr}, '{cyrillic}', '{latin}')"
+    _rebuild(f"SELECT translate({expr}, 'абвгдезийклмнопрстуфхъь', 'abvgdeziyklmnoprstufhay')")
@@ -1,10 +1,11 @@
 from datetime import datetime
 from enum import Enum
 
-from sqlalchemy import Column, DateTime, Enum as SqlEnum, ForeignKey, Integer, String, func
-from sqlalchemy.orm import relationship
+from sqlalchemy import Boolean, Column, Date, DateTime, Enum as SqlEnum, Float, ForeignKey, Index, Integer, String, func
+from sqlalchemy.orm import relationship, validates
 
 from backend.app.database import Base
+from backend.app.tags import TAG_COLUMNS, parse_tags
 
 
 class UserRole(str, Enum):
@@ -39,7 +40,7 @@ class User(Base):
     password_hash = Column(String(255), nullable=False)
     name = Column(String(255), nullable=False)
     role = Column(SqlEnum(UserRole), nullable=False)
-    club_id = Column(Integer, ForeignKey("clubs.id"), nullable=True)
+    club_id = Column(Integer, ForeignKey("clubs.id"), nullable=True, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
 
@@ -47,6 +48,17 @@ class User(Base):
 
 class Drill(Base):
     __tablename__ = "drills"
+    __table_args__ = (
+        # Keyset pagination: every equality filter is paired with the id cursor
+        Index("ix_drills_category_id", "category", "id"),
+        Index("ix_drills_level_id", "level", "id"),
+        Index("ix_drills_complexity_level_id", "complexity_level", "id"),
+        Index("ix_drills_decision_level_id", "decision_level", "id"),
+        Index("ix_drills_intensity_type_id", "intensity_type", "id"),
+        Index("ix_drills_type_of_drill_id", "type_of_drill", "id"),
+        Index("ix_drills_age_range", "age_min", "age_max"),
+        Index("ix_drills_duration_range", "duration_min", "duration_max"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
 
@@ -89,3 +101,122 @@ class Drill(Base):
     intensity_type = Column(String)
     training_goal = Column(String)
     type_of_drill = Column(String)
+
+    # Normalized copy of the packed generator columns (see backend.app.tags)
+    tags = relationship("DrillTag", cascade="all, delete-orphan", passive_deletes=True)
+
+    @validates(*TAG_COLUMNS)
+    def _sync_tags(self, key, value):
+        wanted = parse_tags(value)
+        current = {tag.tag: tag for tag in self.tags if tag.kind == key}
+
+        for name, tag in current.items():
+            if name not in wanted:
+                self.tags.remove(tag)
+        for name in wanted:
+            if name not in current:
+                self.tags.append(DrillTag(kind=key, tag=name))
+
+        return value
+
+
+class DrillTag(Base):
+    __tablename__ = "drill_tags"
+    __table_args__ = (
+        Index("ix_drill_tags_tag_kind", "tag", "kind", "drill_id"),
+    )
+
+    drill_id = Column(Integer, ForeignKey("drills.id", ondelete="CASCADE"), primary_key=True)
+    kind = Column(String(32), primary_key=True)
+    tag = Column(String(100), primary_key=True)
+
+
+class RefreshToken(Base):
+    """Rotating refresh token; only an HMAC of the token value is stored."""
+
+    __tablename__ = "refresh_tokens"
+
+    id = Column(Integer, primary_key=True)
+    user_id = Column(Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=False, index=True)
+    token_hash = Column(String(64), nullable=False, unique=True)
+    # All tokens rotated from one login share a family; reuse revokes the family
+    family_id = Column(String(32), nullable=False, index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False)
+    revoked_at = Column(DateTime(timezone=True))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class SeedState(Base):
+    """Content hash of the last successfully applied seed file."""
+
+    __tablename__ = "seed_state"
+
+    name = Column(String(100), primary_key=True)
+    content_hash = Column(String(64), nullable=False)
+    seeded_at = Column(DateTime(timezone=True), server_default=func.now(), onupdate=func.now())
+
+
+class Athlete(Base):
+    __tablename__ = "athletes"
+
+    id = Column(Integer, primary_key=True)
+    club_id = Column(Integer, ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False, index=True)
+    name = Column(String(255), nullable=False)
+    team = Column(String(100))
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+
+class TrainingSession(Base):
+    """A completed practice; per-athlete load lives in ``AthleteLoad``."""
+
+    __tablename__ = "training_sessions"
+    __table_args__ = (Index("ix_training_sessions_club_id_date", "club_id", "date"),)
+
+    id = Column(Integer, primary_key=True)
+    club_id = Column(Integer, ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False)
+    coach_id = Column(Integer, ForeignKey("users.id", ondelete="SET NULL"))
+    team = Column(String(100))
+    date = Column(Date, nullable=False)
+    duration_minutes = Column(Integer, nullable=False)
+    rpe = Column(Integer)
+    notes = Column(String)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+
+    loads = relationship("AthleteLoad", cascade="all, delete-orphan", passive_deletes=True)
+
+
+class AthleteLoad(Base):
+    """Session-RPE load of one athlete in one session (rpe x minutes)."""
+
+    __tablename__ = "athlete_loads"
+
+    session_id = Column(Integer, ForeignKey("training_sessions.id", ondelete="CASCADE"), primary_key=True)
+    athlete_id = Column(Integer, ForeignKey("athletes.id", ondelete="CASCADE"), primary_key=True, index=True)
+    rpe = Column(Integer, nullable=False)
+    duration_minutes = Column(Integer, nullable=False)
+    load = Column(Integer, nullable=False)
+
+
+class DailyLoad(Base):
+    """Per-athlete daily totals of ``AthleteLoad``, maintained on session writes."""
+
+    __tablename__ = "daily_loads"
+    __table_args__ = (Index("ix_daily_loads_club_id_date", "club_id", "date"),)
+
+    athlete_id = Column(Integer, ForeignKey("athletes.id", ondelete="CASCADE"), primary_key=True)
+    date = Column(Date, primary_key=True)
+    club_id = Column(Integer, ForeignKey("clubs.id", ondelete="CASCADE"), nullable=False)
+    load = Column(Integer, nullable=False)
+    minutes = Column(Integer, nullable=False)
+    sessions = Column(Integer, nullable=False)
+
+
+class RateLimitBucket(Base):
+    """Shared login token bucket (see backend.app.ratelimit); UNLOGGED on PostgreSQL."""
+
+    __tablename__ = "rate_limit_buckets"
+
+    key = Column(String(400), primary_key=True)
+    tokens = Column(Float, nullable=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False, index=True)
+    allowed = Column(Boolean, nullable=False)
@@ -0,0 +1,87 @@
+"""Short-TTL cache of authenticated principals keyed by bearer token.
+
+``get_current_user`` resolves a token to a :class:`Principal` once and then
+serves it from memory until the TTL (or the token's own expiry) runs out.
+Changes to a user's identity, role, club or password evict their entries
+after the committing transaction, in this and every other worker process.
+"""
+
+import time
+from dataclasses import dataclass
+from typing import Optional
+
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import Session
+
+from backend.app import invalidation
+from backend.app.cache import TTLCache
+from backend.app.models import User, UserRole
+from backend.app.settings import settings
+
+# Columns whose change must drop cached principals of that user
+PRINCIPAL_COLUMNS = ("email", "name", "role", "club_id", "password_hash")
+
+
+@dataclass(frozen=True)
+class Principal:
+    id: int
+    email: str
+    name: str
+    role: UserRole
+    club_id: Optional[int]
+
+    @classmethod
+    def from_user(cls, user: User) -> "Principal":
+        return cls(
+            id=user.id,
+            email=user.email,
+            name=user.name,
+            role=user.role,
+            club_id=user.club_id,
+        )
+
+
+principal_cache = TTLCache(
+    max_entries=settings.principal_cache_max_entries,
+    ttl_seconds=settings.principal_cache_ttl_seconds,
+)
+
+
+def remember(token: str, principal: Principal, expires_at: Optional[float] = None) -> None:
+    """Cache ``principal`` for ``token``, never past the token's ``exp``."""
+    ttl = None if expires_at is None else max(expires_at - time.time(), 0)
+    principal_cache.set(token, principal, ttl_seconds=ttl)
+
+
+def invalidate_user(user_id: int, broadcast: bool = True) -> int:
+    if broadcast:
+        invalidation.broadcaster.publish("user", user_id=user_id)
+    return principal_cache.discard_where(lambda principal: principal.id == user_id)
+
+
+invalidation.register("user", lambda message: invalidate_user(message["user_id"], broadcast=False))
+invalidation.register("resync", lambda message: principal_cache.discard_where(lambda principal: True))
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_changed_users(session, flush_context) -> None:
+    changed = session.info.setdefault("changed_user_ids", set())
+    for user in session.deleted:
+        if isinstance(user, User):
+            changed.add(user.id)
+    for user in session.dirty:
+        if isinstance(user, User):
+            state = inspect(user)
+            if any(state.attrs[name].history.has_changes() for name in PRINCIPAL_COLUMNS):
+                changed.add(user.id)
+
+
+@event.listens_for(Session, "after_commit")
+def _evict_changed_users(session) -> None:
+    for user_id in session.info.pop("changed_user_ids", ()):
+        invalidate_user(user_id)
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_changed_users(session) -> None:
+    session.info.pop("changed_user_ids", None)
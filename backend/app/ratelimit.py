@@ -0,0 +1,175 @@
+"""Admission control for CPU-heavy login work.
+
+Two layers protect the bcrypt pool behind ``/auth/login``:
+
+* token buckets per client IP and per email address, which answer 429 with
+  ``Retry-After`` before any password is hashed;
+* ``bcrypt_gate``, a global cap on verifications running or queued in this
+  process, which answers 503 instead of letting a burst queue up behind the
+  bcrypt threads and starve other requests.
+
+Buckets live behind a small backend interface. ``LocalTokenBuckets`` keeps
+them in process memory, so with several workers each one enforces its own
+limits. ``PostgresTokenBuckets`` shares them through the unlogged
+``rate_limit_buckets`` table (migration 0016), updated with one atomic
+upsert per check. ``Settings.login_rate_limit_backend`` picks the backend.
+
+The IP bucket is keyed by ``client_ip``. Clients can send any
+``X-Forwarded-For`` they like, and proxies only append to it, so the
+address is taken ``Settings.trusted_proxy_hops`` entries from the right:
+the one our own outermost proxy saw. Entries further left are never used,
+so rotating a forged header does not buy a fresh bucket.
+"""
+
+import math
+import random
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+
+from sqlalchemy import text
+from starlette.requests import Request
+
+from backend.app.settings import settings
+
+# Share of Postgres checks that also purge idle buckets
+PURGE_PROBABILITY = 0.01
+
+
+def client_ip(request: Request) -> Optional[str]:
+    """Address of the client as seen by the outermost trusted proxy."""
+    peer = request.client.host if request.client else None
+    hops = settings.trusted_proxy_hops
+    if hops <= 0:
+        return peer
+    forwarded = [
+        entry.strip()
+        for header in request.headers.getlist("x-forwarded-for")
+        for entry in header.split(",")
+        if entry.strip()
+    ]
+    # Fewer entries than proxies means the request bypassed them
+    return forwarded[-hops] if len(forwarded) >= hops else peer
+
+
+class LocalTokenBuckets:
+    name = "local"
+
+    def __init__(self, max_keys: int):
+        self.max_keys = max_keys
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    async def take(self, key: str, rate_per_second: float, burst: int) -> float:
+        """Consume one token; return 0 if allowed, else seconds until one is free."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (float(burst), now))
+            tokens = min(float(burst), tokens + (now - updated) * rate_per_second)
+            wait = 0.0 if tokens >= 1 else (1 - tokens) / rate_per_second
+            self._buckets[key] = (tokens - 1 if tokens >= 1 else tokens, now)
+            while len(self._buckets) > self.max_keys:
+                self._buckets.popitem(last=False)
+        return wait
+
+
+# One statement refills, tests and consumes a bucket using the database clock.
+# SET expressions all see the old row, so the refill expression is repeated.
+_REFILL = (
+    "LEAST(:burst, b.tokens + EXTRACT(EPOCH FROM (clock_timestamp() - b.updated_at)) * :rate)"
+)
+_TAKE_SQL = text(
+    f"""
+    INSERT INTO rate_limit_buckets AS b (key, tokens, updated_at, allowed)
+    VALUES (:key, :burst - 1, clock_timestamp(), true)
+    ON CONFLICT (key) DO UPDATE SET
+        allowed = {_REFILL} >= 1,
+        tokens = {_REFILL} - CASE WHEN {_REFILL} >= 1 THEN 1 ELSE 0 END,
+        updated_at = clock_timestamp()
+    RETURNING tokens, allowed
+    """
+)
+_PURGE_SQL = text("DELETE FROM rate_limit_buckets WHERE updated_at < clock_timestamp() - interval '1 day'")
+
+
+class PostgresTokenBuckets:
+    name = "postgres"
+
+    async def take(self, key: str, rate_per_second: float, burst: int) -> float:
+        from backend.app.database import async_engine
+
+        async with async_engine.begin() as conn:
+            row = (
+                await conn.execute(_TAKE_SQL, {"key": key, "rate": rate_per_second, "burst": burst})
+            ).one()
+            if random.random() < PURGE_PROBABILITY:
+                await conn.execute(_PURGE_SQL)
+        return 0.0 if row.allowed else (1 - row.tokens) / rate_per_second
+
+
+class LoginLimiter:
+    def __init__(self, backend):
+        self.backend = backend
+        self.rejected: Dict[str, int] = {"ip": 0, "email": 0}
+        self._lock = threading.Lock()
+
+    async def check(self, ip: Optional[str], email: str) -> Optional[Tuple[str, int]]:
+        """``(scope, retry_after_seconds)`` when the attempt must be refused."""
+        limits = (
+            ("ip", ip, settings.login_ip_rate_per_minute, settings.login_ip_burst),
+            ("email", email.casefold(), settings.login_email_rate_per_minute, settings.login_email_burst),
+        )
+        for scope, value, per_minute, burst in limits:
+            if not value:
+                continue
+            # IP is checked first so a throttled client cannot drain an email's bucket
+            wait = await self.backend.take(f"login:{scope}:{value}", per_minute / 60, burst)
+            if wait > 0:
+                with self._lock:
+                    self.rejected[scope] += 1
+                return scope, max(1, math.ceil(wait))
+        return None
+
+    def counters(self) -> Dict[str, Dict[str, int]]:
+        return {f"login_{scope}": {"rejected": count} for scope, count in self.rejected.items()}
+
+
+class AdmissionGate:
+    """Non-blocking cap on concurrent units of work."""
+
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self.admitted = 0
+        self.rejected = 0
+        self._lock = threading.Lock()
+
+    def try_enter(self) -> bool:
+        with self._lock:
+            if self.in_flight >= self.limit:
+                self.rejected += 1
+                return False
+            self.in_flight += 1
+            self.admitted += 1
+            return True
+
+    def leave(self) -> None:
+        with self._lock:
+            self.in_flight -= 1
+
+    def stats(self) -> Dict[str, int]:
+        return {"limit": self.limit, "in_flight": self.in_flight}
+
+    def counters(self) -> Dict[str, int]:
+        return {"admitted": self.admitted, "rejected": self.rejected}
+
+
+def _make_backend():
+    if settings.login_rate_limit_backend == "postgres":
+        return PostgresTokenBuckets()
+    return LocalTokenBuckets(max_keys=settings.login_rate_limit_max_keys)
+
+
+login_limiter = LoginLimiter(_make_backend())
+bcrypt_gate = AdmissionGate(limit=settings.bcrypt_max_in_flight)
@@ -2,3 +2,6 @@ from .auth import router as auth
 from .users import router as users
 from .clubs import router as clubs
 from .drills import router as drills
+from .health import router as health
+from .metrics import router as metrics
+from .training import router as training
@@ -1,26 +1,35 @@
-from datetime import timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import JWTError
 from pydantic import BaseModel, EmailStr
-from sqlalchemy import select
-from sqlalchemy.orm import Session
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.auth import (
     ACCESS_TOKEN_EXPIRE_MINUTES,
     create_access_token,
     decode_token,
-    verify_password,
+    hash_refresh_token,
+    new_refresh_token,
+    new_token_family,
+    refresh_token_expiry,
+    verify_password_async,
 )
-from backend.app.database import SessionLocal
-from backend.app.models import User, UserRole
+from backend.app.database import get_async_db
+from backend.app.models import RefreshToken, User, UserRole
+from backend.app.principals import Principal, principal_cache, remember
+from backend.app.ratelimit import bcrypt_gate, client_ip, login_limiter
 
 router = APIRouter()
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/auth/login")
 
+# Retry-After sent when every bcrypt slot is taken
+BCRYPT_BUSY_RETRY_SECONDS = 1
+
 
 class LoginRequest(BaseModel):
     email: EmailStr
@@ -29,9 +38,14 @@ class LoginRequest(BaseModel):
 
 class TokenResponse(BaseModel):
     access_token: str
+    refresh_token: str | None = None
     token_type: str = "bearer"
 
 
+class RefreshRequest(BaseModel):
+    refresh_token: str
+
+
 class UserResponse(BaseModel):
     id: int
     email: EmailStr
@@ -43,17 +57,25 @@ class UserResponse(BaseModel):
         from_attributes = True
 
 
-def get_db():
-    db = SessionLocal()
-    try:
-        yield db
-    finally:
-        db.close()
-
-
-async def authenticate_user(db: Session, email: str, password: str) -> User:
-    user = db.execute(select(User).where(User.email == email)).scalar_one_or_none()
-    if not user or not verify_password(password, user.password_hash):
+async def authenticate_user(db: AsyncSession, email: str, password: str) -> User:
+    user = (await db.execute(select(User).where(User.email == email))).scalar_one_or_none()
+    # End the read transaction so the pooled connection is not held idle while
+    # bcrypt queues and runs; expire_on_commit=False keeps ``user`` loaded and
+    # the session checks out a fresh connection for the token write
+    await db.commit()
+    verified = False
+    if user:
+        if not bcrypt_gate.try_enter():
+            raise HTTPException(
+                status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+                detail="Too many logins in progress, try again shortly",
+                headers={"Retry-After": str(BCRYPT_BUSY_RETRY_SECONDS)},
+            )
+        try:
+            verified = await verify_password_async(password, user.password_hash)
+        finally:
+            bcrypt_gate.leave()
+    if not verified:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -64,8 +86,12 @@ async def authenticate_user(db: Session, email: str, password: str) -> User:
 
 async def get_current_user(
     token: Annotated[str, Depends(oauth2_scheme)],
-    db: Annotated[Session, Depends(get_db)],
-) -> User:
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+) -> Principal:
+    principal = principal_cache.get(token)
+    if principal is not None:
+        return principal
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -79,26 +105,134 @@ async def get_current_user(
     except JWTError:
         raise credentials_exception
 
-    user = db.get(User, int(user_id))
+    user = await db.get(User, int(user_id))
     if user is None:
         raise credentials_exception
-    return user
+
+    principal = Principal.from_user(user)
+    remember(token, principal, expires_at=payload.get("exp"))
+    return principal
+
+
+def require_admin(current_user: Annotated[Principal, Depends(get_current_user)]) -> Principal:
+    if current_user.role not in (UserRole.platform_admin, UserRole.bfv_admin):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Administrator role required",
+        )
+    return current_user
+
+
+def _issue_tokens(db: AsyncSession, user: User, family_id: str) -> TokenResponse:
+    """Create an access token plus a new refresh token row in ``family_id``."""
+    access_token = create_access_token(
+        data={"sub": str(user.id), "email": user.email, "role": user.role.value},
+        expires_delta=timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES),
+    )
+    refresh_token = new_refresh_token()
+    db.add(
+        RefreshToken(
+            user_id=user.id,
+            token_hash=hash_refresh_token(refresh_token),
+            family_id=family_id,
+            expires_at=refresh_token_expiry(),
+        )
+    )
+    return TokenResponse(access_token=access_token, refresh_token=refresh_token)
+
+
+async def _revoke_family(db: AsyncSession, family_id: str) -> None:
+    await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.family_id == family_id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
+    )
+
+
+def _as_utc(value: datetime) -> datetime:
+    # SQLite hands back naive datetimes even for timezone-aware columns
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
 
 
 @router.post("/login", response_model=TokenResponse)
 async def login(
     request: LoginRequest,
-    db: Annotated[Session, Depends(get_db)],
+    http_request: Request,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
 ):
+    throttled = await login_limiter.check(client_ip(http_request), request.email)
+    if throttled is not None:
+        scope, retry_after = throttled
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail=f"Too many login attempts for this {scope}",
+            headers={"Retry-After": str(retry_after)},
+        )
+
     user = await authenticate_user(db, request.email, request.password)
-    access_token_expires = timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    access_token = create_access_token(
-        data={"sub": str(user.id), "email": user.email, "role": user.role.value},
-        expires_delta=access_token_expires,
+    tokens = _issue_tokens(db, user, new_token_family())
+    await db.commit()
+    return tokens
+
+
+@router.post("/refresh", response_model=TokenResponse)
+async def refresh(
+    request: RefreshRequest,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    invalid_token = HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Invalid refresh token",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+    row = (
+        await db.execute(
+            select(RefreshToken, User)
+            .join(User, User.id == RefreshToken.user_id)
+            .where(RefreshToken.token_hash == hash_refresh_token(request.refresh_token))
+        )
+    ).one_or_none()
+    if row is None:
+        raise invalid_token
+
+    stored, user = row
+    if _as_utc(stored.expires_at) <= datetime.now(timezone.utc):
+        raise invalid_token
+
+    # Rotate: only the first presenter of a still-valid token wins. A token
+    # that is already revoked has been used before, so the family is burned.
+    rotated = await db.execute(
+        update(RefreshToken)
+        .where(RefreshToken.id == stored.id, RefreshToken.revoked_at.is_(None))
+        .values(revoked_at=datetime.now(timezone.utc))
     )
-    return TokenResponse(access_token=access_token)
+    if rotated.rowcount != 1:
+        await _revoke_family(db, stored.family_id)
+        await db.commit()
+        raise invalid_token
+
+    tokens = _issue_tokens(db, user, stored.family_id)
+    await db.commit()
+    return tokens
+
+
+@router.post("/logout", status_code=status.HTTP_204_NO_CONTENT)
+async def logout(
+    request: RefreshRequest,
+    db: Annotated[AsyncSession, Depends(get_async_db)],
+):
+    family_id = (
+        await db.execute(
+            select(RefreshToken.family_id).where(
+                RefreshToken.token_hash == hash_refresh_token(request.refresh_token)
+            )
+        )
+    ).scalar_one_or_none()
+    if family_id is not None:
+        await _revoke_family(db, family_id)
+        await db.commit()
 
 
 @router.get("/me", response_model=UserResponse)
-async def read_current_user(current_user: Annotated[User, Depends(get_current_user)]):
+async def read_current_user(current_user: Annotated[Principal, Depends(get_current_user)]):
     return current_user
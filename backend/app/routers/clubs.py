@@ -1,12 +1,129 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from typing import Dict, List, Literal, Optional
 
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from pydantic import BaseModel
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, load_only, selectinload
+
+from backend.app.cache import cached_response, catalog_cache, encode_payload
 from backend.app.database import get_db
-from backend.app.models import Club
+from backend.app.export import ExportFormat, export_response
+from backend.app.importer import CLUB_IMPORT, import_csv
+from backend.app.models import Club, User
+from backend.app.principals import Principal
+from backend.app.routers.auth import require_admin
+from backend.app.schemas import USER_COLUMNS, ClubOut, ClubWithMembers, UserOut
+from backend.app.suggest import suggest_clubs
 
 router = APIRouter()
 
 
-@router.get("/", summary="List all clubs")
-def list_clubs(db: Session = Depends(get_db)):
-    return db.query(Club).all()
+class ClubSuggestion(BaseModel):
+    id: int
+    name: str
+    city: Optional[str] = None
+
+
+def _member_counts(db: Session, club_ids: List[int] = None) -> Dict[int, int]:
+    """Members per club in a single GROUP BY over the users.club_id index."""
+    stmt = select(User.club_id, func.count()).where(User.club_id.is_not(None)).group_by(User.club_id)
+    if club_ids is not None:
+        stmt = stmt.where(User.club_id.in_(club_ids))
+    return dict(db.execute(stmt).all())
+
+
+def _club_view(club: Club, **extra) -> dict:
+    # Built from ClubOut so Club.users is never touched (and lazily loaded)
+    return {**ClubOut.model_validate(club).model_dump(), **extra}
+
+
+def _user_columns():
+    return load_only(*(getattr(User, name) for name in USER_COLUMNS))
+
+
+@router.get("/", response_model=List[ClubWithMembers], summary="List all clubs")
+def list_clubs(
+    request: Request,
+    include: List[Literal["member_count"]] = Query([]),
+    db: Session = Depends(get_db),
+):
+    with_counts = "member_count" in include
+
+    def build():
+        clubs = db.query(Club).order_by(Club.id).all()
+        if not with_counts:
+            return encode_payload([ClubOut.model_validate(club) for club in clubs])
+
+        counts = _member_counts(db)
+        return encode_payload([_club_view(club, member_count=counts.get(club.id, 0)) for club in clubs])
+
+    payload = catalog_cache.get_or_build("clubs", ("list", with_counts), build)
+    return cached_response(request, payload)
+
+
+@router.get("/suggest", response_model=List[ClubSuggestion], summary="Autocomplete clubs by name or city")
+def suggest(
+    q: str = Query(..., min_length=1, max_length=100),
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    return suggest_clubs(db, q, limit)
+
+
+@router.get("/export", summary="Stream all clubs as NDJSON or CSV")
+def export_clubs(format: ExportFormat = Query("ndjson")):
+    return export_response(Club, format)
+
+
+@router.post("/import", summary="Bulk import clubs from CSV (admin)")
+def import_clubs(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(True, description="Only report the diff, write nothing"),
+    db: Session = Depends(get_db),
+    _: Principal = Depends(require_admin),
+):
+    try:
+        report = import_csv(db, file.file, CLUB_IMPORT, dry_run=dry_run)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return report.summary()
+
+
+@router.get("/{club_id}", response_model=ClubWithMembers, summary="Get one club")
+def get_club(
+    club_id: int,
+    request: Request,
+    include: List[Literal["users", "member_count"]] = Query([]),
+    db: Session = Depends(get_db),
+):
+    def build():
+        stmt = select(Club).where(Club.id == club_id)
+        if "users" in include:
+            stmt = stmt.options(selectinload(Club.users).options(_user_columns()))
+        club = db.execute(stmt).scalar_one_or_none()
+        if club is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Club not found")
+
+        extra = {}
+        if "users" in include:
+            extra["users"] = [UserOut.model_validate(user) for user in club.users]
+            extra["member_count"] = len(club.users)
+        elif "member_count" in include:
+            extra["member_count"] = _member_counts(db, [club_id]).get(club_id, 0)
+        return encode_payload(_club_view(club, **extra))
+
+    key = ("detail", club_id, tuple(sorted(set(include))))
+    return cached_response(request, catalog_cache.get_or_build("clubs", key, build))
+
+
+@router.get("/{club_id}/users", response_model=List[UserOut], summary="Club roster")
+def list_club_users(club_id: int, request: Request, db: Session = Depends(get_db)):
+    def build():
+        if db.get(Club, club_id) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Club not found")
+        users = db.execute(
+            select(User).options(_user_columns()).where(User.club_id == club_id).order_by(User.id)
+        ).scalars()
+        return encode_payload([UserOut.model_validate(user) for user in users])
+
+    return cached_response(request, catalog_cache.get_or_build("clubs", ("roster", club_id), build))
@@ -1,12 +1,368 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from typing import Any, Dict, List, Literal, Optional
 
-from backend.app.database import get_db
-from backend.app.models import Drill
+from fastapi import APIRouter, Depends, File, HTTPException, Query, Request, UploadFile, status
+from pydantic import BaseModel, ConfigDict, Field, ValidationError, field_validator
+from sqlalchemy import and_, case, func, literal, or_, select, update
+from sqlalchemy.orm import Session, load_only
+
+from backend.app.cache import cached_response, catalog_cache, encode_payload
+from backend.app.catalog import get_catalog
+from backend.app.database import AsyncSessionLocal, get_db
+from backend.app.drill_writes import write_drills
+from backend.app.export import ExportFormat, export_response
+from backend.app.generator import generate_plan
+from backend.app.importer import DRILL_IMPORT, import_csv
+from backend.app.media import (
+    MediaTooLarge,
+    drill_media_path,
+    media_kind,
+    media_url,
+    safe_filename,
+    save_stream,
+    schedule_thumbnail,
+    thumbnail_path,
+)
+from backend.app.models import Drill, DrillTag
+from backend.app.principals import Principal
+from backend.app.routers.auth import require_admin
+from backend.app.schemas import DRILL_SUMMARY_COLUMNS, DrillDetail, DrillSummary
+from backend.app.search import search_drills
+from backend.app.settings import settings
+from backend.app.similarity import similar_drills
+from backend.app.tags import parse_tag_query
 
 router = APIRouter()
 
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 500
+MAX_BATCH_ITEMS = 1000
+
+
+class GenerateRequest(BaseModel):
+    duration: int = Field(..., gt=0, le=600, description="Time budget in minutes")
+    age: Optional[int] = Field(None, ge=0)
+    focus: List[str] = Field(default_factory=list, description="Focus skill domains, e.g. attack, block")
+    intensity_curve: List[str] = Field(
+        default_factory=list,
+        description="Intensity per consecutive segment, e.g. low, high, medium",
+    )
+    max_drills: int = Field(12, ge=1, le=50)
+
+
+class PlanItem(BaseModel):
+    drill_id: int
+    name: str
+    minutes: int
+    segment: int
+    intensity_type: str
+    skill_domains: List[str]
+
+
+class PlanResponse(BaseModel):
+    total_minutes: int
+    items: List[PlanItem]
+
+
+def _tag_condition(kind: Optional[str], name: str):
+    if kind is None:
+        return DrillTag.tag == name
+    return and_(DrillTag.tag == name, DrillTag.kind == kind)
+
+
+class DrillWrite(BaseModel):
+    """Drill fields for batch writes; omitted fields keep their stored value."""
+
+    model_config = ConfigDict(extra="forbid")
+
+    id: Optional[int] = Field(None, gt=0, description="Omit to create a drill with a new id")
+    name: Optional[str] = Field(None, min_length=1, max_length=255)
+    category: Optional[str] = Field(None, max_length=255)
+    level: Optional[str] = Field(None, max_length=255)
+    skill_focus: Optional[str] = None
+    goal: Optional[str] = None
+    description: Optional[str] = None
+    variations: Optional[str] = None
+    players: Optional[str] = None
+    equipment: Optional[str] = None
+    rpe: Optional[str] = None
+    duration_min: Optional[int] = Field(None, ge=0)
+    duration_max: Optional[int] = Field(None, ge=0)
+    image_urls: Optional[str] = None
+    video_urls: Optional[str] = None
+    skill_domains: Optional[str] = None
+    game_phases: Optional[str] = None
+    tactical_focus: Optional[str] = None
+    technical_focus: Optional[str] = None
+    position_focus: Optional[str] = None
+    zone_focus: Optional[str] = None
+    complexity_level: Optional[int] = None
+    decision_level: Optional[int] = None
+    age_min: Optional[int] = Field(None, ge=0)
+    age_max: Optional[int] = Field(None, ge=0)
+    intensity_type: Optional[str] = None
+    training_goal: Optional[str] = None
+    type_of_drill: Optional[str] = None
+
+    @field_validator("name")
+    @classmethod
+    def _name_not_null(cls, value):
+        # Runs only for a supplied name: omitted keeps the stored one, null is NOT NULL
+        if value is None:
+            raise ValueError("name cannot be null")
+        return value
+
+
+class BatchRequest(BaseModel):
+    # Items are validated one by one so a bad item, even a non-object, does not reject the batch
+    upsert: List[Any] = Field(default_factory=list, max_length=MAX_BATCH_ITEMS)
+    delete: List[int] = Field(default_factory=list, max_length=MAX_BATCH_ITEMS)
+
+
+class BatchItemResult(BaseModel):
+    index: Optional[int] = None
+    id: Optional[int] = None
+    status: Literal["created", "updated", "deleted", "not_found", "error"]
+    error: Optional[str] = None
+
+
+class BatchResponse(BaseModel):
+    upsert: List[BatchItemResult]
+    delete: List[BatchItemResult]
+
+
+@router.get("/", response_model=List[DrillSummary], summary="List drills (keyset paginated)")
+def list_drills(
+    request: Request,
+    after: Optional[int] = Query(None, description="Return drills with id greater than this cursor"),
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    category: Optional[str] = None,
+    level: Optional[str] = None,
+    complexity_level: Optional[int] = None,
+    decision_level: Optional[int] = None,
+    intensity_type: Optional[str] = None,
+    type_of_drill: Optional[str] = None,
+    age: Optional[int] = Query(None, ge=0, description="Only drills suitable for this age"),
+    min_duration: Optional[int] = Query(None, ge=0, description="Drill can run at least this many minutes"),
+    max_duration: Optional[int] = Query(None, ge=0, description="Drill fits in this many minutes"),
+    tag: List[str] = Query([], description="Tag filter as kind:tag (e.g. skill_domains:block) or a bare tag"),
+    tag_match: Literal["all", "any"] = "all",
+    db: Session = Depends(get_db),
+):
+    try:
+        tag_terms = parse_tag_query(tag)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+
+    filters = {
+        "category": category,
+        "level": level,
+        "complexity_level": complexity_level,
+        "decision_level": decision_level,
+        "intensity_type": intensity_type,
+        "type_of_drill": type_of_drill,
+    }
+    cache_key = (
+        after, limit, tuple(filters.items()), age, min_duration, max_duration,
+        tuple(tag_terms), tag_match,
+    )
+
+    def build():
+        stmt = select(Drill).options(load_only(*(getattr(Drill, name) for name in DRILL_SUMMARY_COLUMNS)))
+        for name, value in filters.items():
+            if value is not None:
+                stmt = stmt.where(getattr(Drill, name) == value)
+
+        # Open-ended bounds (NULL) are treated as "no restriction"
+        if age is not None:
+            stmt = stmt.where(or_(Drill.age_min.is_(None), Drill.age_min <= age))
+            stmt = stmt.where(or_(Drill.age_max.is_(None), Drill.age_max >= age))
+        if max_duration is not None:
+            stmt = stmt.where(or_(Drill.duration_min.is_(None), Drill.duration_min <= max_duration))
+        if min_duration is not None:
+            stmt = stmt.where(or_(Drill.duration_max.is_(None), Drill.duration_max >= min_duration))
+
+        if tag_terms:
+            conditions = [_tag_condition(kind, name) for kind, name in tag_terms]
+            if tag_match == "all":
+                for condition in conditions:
+                    stmt = stmt.where(Drill.id.in_(select(DrillTag.drill_id).where(condition)))
+            else:
+                stmt = stmt.where(Drill.id.in_(select(DrillTag.drill_id).where(or_(*conditions))))
+
+        if after is not None:
+            stmt = stmt.where(Drill.id > after)
+
+        # Fetch one extra row to know whether another page exists
+        drills = db.execute(stmt.order_by(Drill.id).limit(limit + 1)).scalars().all()
+        headers = {}
+        if len(drills) > limit:
+            drills = drills[:limit]
+            headers["X-Next-Cursor"] = str(drills[-1].id)
+        return encode_payload([DrillSummary.model_validate(drill) for drill in drills], headers)
+
+    return cached_response(request, catalog_cache.get_or_build("drills", cache_key, build))
+
+
+@router.post("/generate", response_model=PlanResponse, summary="Generate a practice plan")
+def generate_drills_plan(request: GenerateRequest, db: Session = Depends(get_db)):
+    plan = generate_plan(
+        get_catalog(db),
+        duration=request.duration,
+        age=request.age,
+        focus=request.focus,
+        intensity_curve=request.intensity_curve,
+        max_drills=request.max_drills,
+    )
+    items = [PlanItem(**vars(block)) for block in plan]
+    return PlanResponse(total_minutes=sum(item.minutes for item in items), items=items)
+
+
+@router.get("/search", summary="Full-text search over drill descriptions")
+def search(
+    request: Request,
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db),
+):
+    payload = catalog_cache.get_or_build(
+        "drills",
+        ("search", q.casefold().strip(), limit),
+        lambda: encode_payload(search_drills(db, q, limit)),
+    )
+    return cached_response(request, payload)
+
+
+@router.get("/export", summary="Stream all drills as NDJSON or CSV")
+def export_drills(format: ExportFormat = Query("ndjson")):
+    return export_response(Drill, format)
+
+
+@router.post("/import", summary="Bulk import drills from CSV (admin)")
+def import_drills(
+    file: UploadFile = File(...),
+    dry_run: bool = Query(True, description="Only report the diff, write nothing"),
+    db: Session = Depends(get_db),
+    _: Principal = Depends(require_admin),
+):
+    try:
+        report = import_csv(db, file.file, DRILL_IMPORT, dry_run=dry_run)
+    except ValueError as exc:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail=str(exc))
+    return report.summary()
+
+
+@router.post(
+    "/batch",
+    response_model=BatchResponse,
+    response_model_exclude_none=True,
+    summary="Create, update and delete drills in bulk (admin)",
+)
+def batch_write_drills(
+    payload: BatchRequest,
+    db: Session = Depends(get_db),
+    _: Principal = Depends(require_admin),
+):
+    records: List[Optional[dict]] = []
+    errors: Dict[int, str] = {}
+    for index, item in enumerate(payload.upsert):
+        try:
+            records.append(DrillWrite.model_validate(item).model_dump(exclude_unset=True))
+        except ValidationError as exc:
+            records.append(None)
+            errors[index] = "; ".join(
+                ": ".join(filter(None, [".".join(str(part) for part in error["loc"]), error["msg"]]))
+                for error in exc.errors()
+            )
+
+    upserted, deleted = write_drills(db, records, payload.delete)
+    for index, message in errors.items():
+        item = payload.upsert[index]
+        raw_id = item.get("id") if isinstance(item, dict) else None
+        # The raw id may be what failed validation; echo it only when usable
+        drill_id = raw_id if type(raw_id) is int and raw_id > 0 else None
+        upserted[index] = {"id": drill_id, "status": "error", "error": message}
+    return BatchResponse(
+        upsert=[BatchItemResult(index=index, **result) for index, result in enumerate(upserted)],
+        delete=[BatchItemResult(**result) for result in deleted],
+    )
+
+
+@router.get("/{drill_id}", response_model=DrillDetail, summary="Get one drill with all fields")
+def get_drill(drill_id: int, request: Request, db: Session = Depends(get_db)):
+    def build():
+        drill = db.get(Drill, drill_id)
+        if drill is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Drill not found")
+        return encode_payload(DrillDetail.model_validate(drill))
+
+    return cached_response(request, catalog_cache.get_or_build("drills", ("detail", drill_id), build))
+
+
+@router.get("/{drill_id}/similar", summary="Drills most similar by tags, complexity and age band")
+def get_similar_drills(
+    drill_id: int,
+    request: Request,
+    limit: int = Query(10, ge=1, le=50),
+    db: Session = Depends(get_db),
+):
+    def build():
+        results = similar_drills(db, drill_id, limit)
+        if results is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Drill not found")
+        return encode_payload(results)
+
+    return cached_response(request, catalog_cache.get_or_build("drills", ("similar", drill_id, limit), build))
+
+
+@router.put(
+    "/{drill_id}/media/{filename}",
+    status_code=status.HTTP_201_CREATED,
+    summary="Upload an image or video for a drill (raw request body)",
+)
+async def upload_drill_media(
+    drill_id: int,
+    filename: str,
+    request: Request,
+    _: Principal = Depends(require_admin),
+):
+    name = safe_filename(filename)
+    kind = media_kind(name) if name else None
+    if kind is None:
+        raise HTTPException(
+            status_code=status.HTTP_415_UNSUPPORTED_MEDIA_TYPE,
+            detail="Unsupported media file type",
+        )
+
+    # Sessions are opened around the DB work only: an upload can take minutes
+    # and must not hold a pool connection that logins also need
+    async with AsyncSessionLocal() as db:
+        if await db.scalar(select(Drill.id).where(Drill.id == drill_id)) is None:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Drill not found")
+
+    path = drill_media_path(drill_id, name)
+    try:
+        size = await save_stream(request.stream(), path, settings.media_max_upload_bytes)
+    except MediaTooLarge as exc:
+        raise HTTPException(status_code=status.HTTP_413_REQUEST_ENTITY_TOO_LARGE, detail=str(exc))
+
+    url = media_url(path)
+    column = Drill.image_urls if kind == "image" else Drill.video_urls
+    # One UPDATE appends the URL, so concurrent uploads to a drill cannot drop each other's
+    padded = literal(";") + func.coalesce(column, "") + literal(";")
+    appended = case(
+        (padded.contains(f";{url};", autoescape=True), column),
+        (func.coalesce(column, "") == "", url),
+        else_=column + literal(";") + literal(url),
+    )
+    async with AsyncSessionLocal() as db:
+        result = await db.execute(update(Drill).where(Drill.id == drill_id).values({column: appended}))
+        await db.commit()
+    if result.rowcount == 0:
+        # Deleted while the upload was streaming
+        path.unlink(missing_ok=True)
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Drill not found")
+    # Core UPDATEs bypass the ORM listeners that bump versions
+    catalog_cache.bump("drills", {drill_id})
 
-@router.get("/", summary="List all drills")
-def list_drills(db: Session = Depends(get_db)):
-    return db.query(Drill).all()
+    thumbnail_url = media_url(thumbnail_path(path)) if schedule_thumbnail(path) else None
+    return {"url": url, "kind": kind, "size": size, "thumbnail_url": thumbnail_url}
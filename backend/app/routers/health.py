@@ -0,0 +1,27 @@
+from fastapi import APIRouter, Response, status
+
+from backend.app.database import pool_status
+from backend.app.init_db import seed_failed, seed_ready
+
+router = APIRouter()
+
+
+@router.get("/live", summary="Liveness probe")
+def live():
+    return {"status": "ok"}
+
+
+@router.get("/ready", summary="Readiness probe (503 until startup seeding succeeded)")
+def ready(response: Response):
+    if not seed_ready.is_set():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "seeding"}
+    if seed_failed.is_set():
+        response.status_code = status.HTTP_503_SERVICE_UNAVAILABLE
+        return {"status": "seed_failed"}
+    return {"status": "ready"}
+
+
+@router.get("/pool", summary="Connection pool counters and gauges")
+def pool():
+    return pool_status()
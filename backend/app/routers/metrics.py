@@ -0,0 +1,64 @@
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from backend.app.cache import catalog_cache
+from backend.app.database import pool_status
+from backend.app.metrics import render_prometheus
+from backend.app.principals import principal_cache
+from backend.app.ratelimit import bcrypt_gate, login_limiter
+
+router = APIRouter()
+
+# Stats fields that only ever increase; everything else is a current value.
+# Cache versions count bumps, so they are counters too.
+COUNTER_FIELDS = {
+    "connects",
+    "checkouts",
+    "checkins",
+    "invalidations",
+    "waits",
+    "wait_seconds",
+    "timeouts",
+    "hits",
+    "misses",
+    "admitted",
+    "rejected",
+}
+
+
+def _is_counter(field: str) -> bool:
+    return field in COUNTER_FIELDS or field.startswith("version_")
+
+
+def _split(series):
+    """``(gauges, counters)`` from ``{prefix: (label, {label_value: {field: value}})}``."""
+    gauges, counters = {}, {}
+    for prefix, (label, values) in series.items():
+        for target, wanted in ((gauges, False), (counters, True)):
+            target[prefix] = (
+                label,
+                {key: {f: v for f, v in fields.items() if _is_counter(f) == wanted} for key, fields in values.items()},
+            )
+    return gauges, counters
+
+
+@router.get("/metrics", response_class=PlainTextResponse, summary="Prometheus metrics")
+def metrics():
+    gauges, counters = _split(
+        {
+            "db_pool": ("engine", pool_status()),
+            "app_cache": (
+                "cache",
+                {
+                    "catalog": catalog_cache.stats(),
+                    "principal": principal_cache.stats(),
+                },
+            ),
+            "auth_admission": (
+                "gate",
+                {**login_limiter.counters(), "bcrypt": {**bcrypt_gate.stats(), **bcrypt_gate.counters()}},
+            ),
+        }
+    )
+    body = render_prometheus(gauges, extra_counters=counters)
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
@@ -0,0 +1,230 @@
+from datetime import date, timedelta
+from typing import List, Optional
+
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from pydantic import BaseModel, Field, model_validator
+from sqlalchemy import select
+from sqlalchemy.orm import Session, selectinload
+
+from backend.app.database import get_db
+from backend.app.models import Athlete, AthleteLoad, Club, TrainingSession, UserRole
+from backend.app.principals import Principal
+from backend.app.routers.auth import get_current_user
+from backend.app.training_load import load_analytics, refresh_daily_loads, session_load
+
+router = APIRouter()
+
+MAX_ANALYTICS_DAYS = 400
+
+
+class AthleteCreate(BaseModel):
+    club_id: int
+    name: str = Field(..., min_length=1, max_length=255)
+    team: Optional[str] = Field(None, max_length=100)
+
+
+class AthleteOut(BaseModel):
+    id: int
+    club_id: int
+    name: str
+    team: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+
+class AthleteEntry(BaseModel):
+    athlete_id: int
+    rpe: Optional[int] = Field(None, ge=0, le=10, description="Defaults to the session RPE")
+    duration_minutes: Optional[int] = Field(None, gt=0, le=600, description="Defaults to the session duration")
+
+
+class SessionCreate(BaseModel):
+    club_id: int
+    team: Optional[str] = Field(None, max_length=100)
+    date: date
+    duration_minutes: int = Field(..., gt=0, le=600)
+    rpe: Optional[int] = Field(None, ge=0, le=10, description="Team RPE (CR-10) applied to every athlete by default")
+    notes: Optional[str] = None
+    athletes: List[AthleteEntry] = Field(..., min_length=1)
+
+    @model_validator(mode="after")
+    def _rpe_for_everyone(self):
+        if self.rpe is None and any(entry.rpe is None for entry in self.athletes):
+            raise ValueError("rpe is required for the session or for every athlete")
+        if len({entry.athlete_id for entry in self.athletes}) != len(self.athletes):
+            raise ValueError("athletes must not repeat")
+        return self
+
+
+class AthleteLoadOut(BaseModel):
+    athlete_id: int
+    rpe: int
+    duration_minutes: int
+    load: int
+
+    class Config:
+        from_attributes = True
+
+
+class SessionOut(BaseModel):
+    id: int
+    club_id: int
+    coach_id: Optional[int] = None
+    team: Optional[str] = None
+    date: date
+    duration_minutes: int
+    rpe: Optional[int] = None
+    notes: Optional[str] = None
+    loads: List[AthleteLoadOut]
+
+    class Config:
+        from_attributes = True
+
+
+def _check_club_access(principal: Principal, club_id: int) -> None:
+    if principal.role in (UserRole.platform_admin, UserRole.bfv_admin):
+        return
+    if principal.club_id != club_id:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not a member of this club")
+
+
+def _get_session(db: Session, session_id: int, principal: Principal) -> TrainingSession:
+    session = db.execute(
+        select(TrainingSession).options(selectinload(TrainingSession.loads)).where(TrainingSession.id == session_id)
+    ).scalar_one_or_none()
+    if session is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Session not found")
+    _check_club_access(principal, session.club_id)
+    return session
+
+
+@router.post("/athletes", response_model=AthleteOut, status_code=status.HTTP_201_CREATED, summary="Add an athlete")
+def create_athlete(
+    payload: AthleteCreate,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_user),
+):
+    _check_club_access(principal, payload.club_id)
+    if db.get(Club, payload.club_id) is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Club not found")
+    athlete = Athlete(**payload.model_dump())
+    db.add(athlete)
+    db.commit()
+    return athlete
+
+
+@router.get("/athletes", response_model=List[AthleteOut], summary="Athletes of a club")
+def list_athletes(
+    club_id: int,
+    team: Optional[str] = None,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_user),
+):
+    _check_club_access(principal, club_id)
+    stmt = select(Athlete).where(Athlete.club_id == club_id)
+    if team is not None:
+        stmt = stmt.where(Athlete.team == team)
+    return db.execute(stmt.order_by(Athlete.id)).scalars().all()
+
+
+@router.post("/sessions", response_model=SessionOut, status_code=status.HTTP_201_CREATED, summary="Log a session")
+def create_session(
+    payload: SessionCreate,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_user),
+):
+    _check_club_access(principal, payload.club_id)
+    athlete_ids = [entry.athlete_id for entry in payload.athletes]
+    known = set(
+        db.execute(
+            select(Athlete.id).where(Athlete.id.in_(athlete_ids), Athlete.club_id == payload.club_id)
+        ).scalars()
+    )
+    unknown = sorted(set(athlete_ids) - known)
+    if unknown:
+        raise HTTPException(
+            status_code=status.HTTP_422_UNPROCESSABLE_ENTITY,
+            detail=f"Athletes not in club {payload.club_id}: {unknown}",
+        )
+
+    session = TrainingSession(
+        coach_id=principal.id,
+        **payload.model_dump(exclude={"athletes"}),
+    )
+    for entry in payload.athletes:
+        rpe = payload.rpe if entry.rpe is None else entry.rpe
+        minutes = entry.duration_minutes or payload.duration_minutes
+        session.loads.append(
+            AthleteLoad(athlete_id=entry.athlete_id, rpe=rpe, duration_minutes=minutes, load=session_load(rpe, minutes))
+        )
+    db.add(session)
+    db.flush()
+    refresh_daily_loads(db, payload.club_id, ((athlete_id, payload.date) for athlete_id in athlete_ids))
+    db.commit()
+    return session
+
+
+@router.get("/sessions", response_model=List[SessionOut], summary="Sessions of a club in a date range")
+def list_sessions(
+    club_id: int,
+    start: date,
+    end: date,
+    team: Optional[str] = None,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_user),
+):
+    _check_club_access(principal, club_id)
+    stmt = (
+        select(TrainingSession)
+        .options(selectinload(TrainingSession.loads))
+        .where(TrainingSession.club_id == club_id, TrainingSession.date.between(start, end))
+    )
+    if team is not None:
+        stmt = stmt.where(TrainingSession.team == team)
+    return db.execute(stmt.order_by(TrainingSession.date, TrainingSession.id)).scalars().all()
+
+
+@router.get("/sessions/{session_id}", response_model=SessionOut, summary="Get one session")
+def get_session(
+    session_id: int,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_user),
+):
+    return _get_session(db, session_id, principal)
+
+
+@router.delete("/sessions/{session_id}", status_code=status.HTTP_204_NO_CONTENT, summary="Delete a session")
+def delete_session(
+    session_id: int,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_user),
+):
+    session = _get_session(db, session_id, principal)
+    keys = [(load.athlete_id, session.date) for load in session.loads]
+    club_id = session.club_id
+    db.delete(session)
+    db.flush()
+    refresh_daily_loads(db, club_id, keys)
+    db.commit()
+    return Response(status_code=status.HTTP_204_NO_CONTENT)
+
+
+@router.get("/analytics", summary="Daily load, ACWR, monotony and strain per athlete")
+def analytics(
+    club_id: int,
+    start: Optional[date] = Query(None, description="Defaults to 28 days before end"),
+    end: Optional[date] = Query(None, description="Defaults to today"),
+    team: Optional[str] = None,
+    db: Session = Depends(get_db),
+    principal: Principal = Depends(get_current_user),
+):
+    _check_club_access(principal, club_id)
+    end = end or date.today()
+    start = start or end - timedelta(days=27)
+    if start > end or (end - start).days >= MAX_ANALYTICS_DAYS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"start must precede end by less than {MAX_ANALYTICS_DAYS} days",
+        )
+    return load_analytics(db, club_id, start, end, team)
@@ -1,12 +1,37 @@
-from fastapi import APIRouter, Depends
-from sqlalchemy.orm import Session
+from typing import List, Literal
+
+from fastapi import APIRouter, Depends, Query
+from sqlalchemy import select
+from sqlalchemy.orm import Session, joinedload, load_only
 
 from backend.app.database import get_db
+from backend.app.export import ExportFormat, export_response
 from backend.app.models import User
+from backend.app.schemas import USER_COLUMNS, UserOut, UserWithClub
 
 router = APIRouter()
 
 
-@router.get("/", summary="List all users")
-def list_users(db: Session = Depends(get_db)):
-    return db.query(User).all()
+@router.get(
+    "/",
+    response_model=List[UserWithClub],
+    response_model_exclude_unset=True,
+    summary="List all users",
+)
+def list_users(
+    include: List[Literal["club"]] = Query([]),
+    db: Session = Depends(get_db),
+):
+    # password_hash is never loaded, let alone serialized
+    stmt = select(User).options(load_only(*(getattr(User, name) for name in USER_COLUMNS)))
+    if "club" in include:
+        # One LEFT OUTER JOIN instead of a lazy load per user
+        stmt = stmt.options(joinedload(User.club))
+    users = db.execute(stmt.order_by(User.id)).scalars().all()
+    view = UserWithClub if "club" in include else UserOut
+    return [view.model_validate(user) for user in users]
+
+
+@router.get("/export", summary="Stream all users as NDJSON or CSV")
+def export_users(format: ExportFormat = Query("ndjson")):
+    return export_response(User, format, exclude=("password_hash",))
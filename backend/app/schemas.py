@@ -0,0 +1,91 @@
+"""Response schemas shared by the list and detail endpoints.
+
+List endpoints return the slim ``*Summary`` views and load only the matching
+columns (see ``DRILL_SUMMARY_COLUMNS``); detail endpoints return everything.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+
+from pydantic import BaseModel, ConfigDict
+
+from backend.app.models import UserRole
+
+
+class DrillSummary(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    category: Optional[str] = None
+    level: Optional[str] = None
+    duration_min: Optional[int] = None
+    duration_max: Optional[int] = None
+    age_min: Optional[int] = None
+    age_max: Optional[int] = None
+    complexity_level: Optional[int] = None
+    decision_level: Optional[int] = None
+    intensity_type: Optional[str] = None
+    type_of_drill: Optional[str] = None
+    skill_domains: Optional[str] = None
+    game_phases: Optional[str] = None
+
+
+class DrillDetail(DrillSummary):
+    skill_focus: Optional[str] = None
+    goal: Optional[str] = None
+    description: Optional[str] = None
+    variations: Optional[str] = None
+    players: Optional[str] = None
+    equipment: Optional[str] = None
+    rpe: Optional[str] = None
+    image_urls: Optional[str] = None
+    video_urls: Optional[str] = None
+    tactical_focus: Optional[str] = None
+    technical_focus: Optional[str] = None
+    position_focus: Optional[str] = None
+    zone_focus: Optional[str] = None
+    training_goal: Optional[str] = None
+
+
+DRILL_SUMMARY_COLUMNS = tuple(DrillSummary.model_fields)
+
+
+class ClubOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    name: str
+    city: Optional[str] = None
+    country: Optional[str] = None
+    address: Optional[str] = None
+    contact_email: Optional[str] = None
+    contact_phone: Optional[str] = None
+    website_url: Optional[str] = None
+    logo_url: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+class UserOut(BaseModel):
+    model_config = ConfigDict(from_attributes=True)
+
+    id: int
+    email: str
+    name: str
+    role: UserRole
+    club_id: Optional[int] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+
+USER_COLUMNS = tuple(UserOut.model_fields)
+
+
+class ClubWithMembers(ClubOut):
+    member_count: Optional[int] = None
+    users: Optional[List[UserOut]] = None
+
+
+class UserWithClub(UserOut):
+    club: Optional[ClubOut] = None
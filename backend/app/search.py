@@ -0,0 +1,136 @@
+"""Full-text search over drill text fields.
+
+On PostgreSQL the ``drills.search_vector`` generated ``tsvector`` column
+(migration 0010) and its GIN index do the matching and ranking. Other
+databases (SQLite in tests and local runs) use an in-memory BM25 inverted
+index built from the same fields and rebuilt when the drills version moves.
+
+Both backends use the ``simple`` (non-stemming) configuration and treat every
+query token as a prefix that must be present, which copes reasonably with
+Bulgarian inflection without a dedicated dictionary.
+"""
+
+import bisect
+import re
+from typing import Dict, List, Mapping, Sequence
+
+import numpy as np
+from sqlalchemy import func, literal_column, select
+from sqlalchemy.orm import Session
+
+from backend.app.cache import VersionedSnapshot
+from backend.app.models import Drill
+
+# Field weights; mirrored by the A/B/C weights of the tsvector in migration 0010
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "skill_focus": 2.0,
+    "goal": 2.0,
+    "description": 1.0,
+    "variations": 1.0,
+}
+RESULT_COLUMNS = ("id", "name", "category", "level", "goal")
+
+BM25_K1 = 1.2
+BM25_B = 0.75
+MAX_PREFIX_EXPANSIONS = 50
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> List[str]:
+    """Case-folded word tokens; ``\\w`` covers Cyrillic as well as Latin."""
+    return _TOKEN.findall((text or "").casefold())
+
+
+class SearchIndex:
+    def __init__(self, rows: Sequence[Mapping]):
+        self.results = [{name: row[name] for name in RESULT_COLUMNS} for row in rows]
+
+        postings: Dict[str, Dict[int, float]] = {}
+        lengths = np.zeros(len(rows), dtype=np.float64)
+        for doc, row in enumerate(rows):
+            for field, weight in FIELD_WEIGHTS.items():
+                for token in tokenize(row[field]):
+                    term = postings.setdefault(token, {})
+                    term[doc] = term.get(doc, 0.0) + weight
+                    lengths[doc] += weight
+
+        self.terms = sorted(postings)
+        self.postings = {
+            term: (
+                np.fromiter(docs.keys(), dtype=np.int64, count=len(docs)),
+                np.fromiter(docs.values(), dtype=np.float64, count=len(docs)),
+            )
+            for term, docs in postings.items()
+        }
+        self.lengths = lengths
+        self.avg_length = float(lengths.mean()) if len(rows) else 0.0
+
+    @classmethod
+    def from_session(cls, db: Session) -> "SearchIndex":
+        columns = [getattr(Drill, name) for name in dict.fromkeys((*RESULT_COLUMNS, *FIELD_WEIGHTS))]
+        rows = db.execute(select(*columns).order_by(Drill.id)).mappings().all()
+        return cls(rows)
+
+    def _expand(self, prefix: str) -> List[str]:
+        start = bisect.bisect_left(self.terms, prefix)
+        end = bisect.bisect_left(self.terms, prefix + "\uffff")
+        return self.terms[start:min(end, start + MAX_PREFIX_EXPANSIONS)]
+
+    def search(self, query: str, limit: int) -> List[dict]:
+        tokens = tokenize(query)
+        if not tokens or not self.results:
+            return []
+
+        docs = len(self.results)
+        scores = np.zeros(docs, dtype=np.float64)
+        matched_all = np.ones(docs, dtype=bool)
+        norm = BM25_K1 * (1 - BM25_B + BM25_B * self.lengths / (self.avg_length or 1.0))
+
+        for token in tokens:
+            matched = np.zeros(docs, dtype=bool)
+            for term in self._expand(token):
+                rows, tf = self.postings[term]
+                idf = np.log(1 + (docs - len(rows) + 0.5) / (len(rows) + 0.5))
+                scores[rows] += idf * tf * (BM25_K1 + 1) / (tf + norm[rows])
+                matched[rows] = True
+            matched_all &= matched
+
+        hits = np.flatnonzero(matched_all)
+        if len(hits) > limit:
+            hits = hits[np.argpartition(-scores[hits], limit - 1)[:limit]]
+        hits = hits[np.lexsort((hits, -scores[hits]))]
+        return [{**self.results[doc], "score": round(float(scores[doc]), 4)} for doc in hits]
+
+
+_snapshot = VersionedSnapshot("drills", SearchIndex.from_session)
+
+
+def _search_postgres(db: Session, query: str, limit: int) -> List[dict]:
+    tokens = tokenize(query)
+    if not tokens:
+        return []
+
+    # Tokens are \w+ only, so they are safe to splice into tsquery syntax
+    tsquery = func.to_tsquery("simple", " & ".join(f"{token}:*" for token in tokens))
+    vector = literal_column("drills.search_vector")
+    rank = func.ts_rank_cd(vector, tsquery)
+
+    stmt = (
+        select(*(getattr(Drill, name) for name in RESULT_COLUMNS), rank.label("score"))
+        .where(vector.op("@@")(tsquery))
+        .order_by(rank.desc(), Drill.id)
+        .limit(limit)
+    )
+    return [
+        {**{name: row[name] for name in RESULT_COLUMNS}, "score": round(float(row["score"]), 4)}
+        for row in db.execute(stmt).mappings()
+    ]
+
+
+def search_drills(db: Session, query: str, limit: int) -> List[dict]:
+    """Ranked drill matches for ``query``, best first."""
+    if db.get_bind().dialect.name == "postgresql":
+        return _search_postgres(db, query, limit)
+    return _snapshot.get(db).search(query, limit)
@@ -7,6 +7,7 @@ from sqlalchemy.exc import SQLAlchemyError, OperationalError
 
 from backend.app.database import SessionLocal
 from backend.app.models import Club
+from backend.app.seed.state import file_hash, is_seeded, mark_seeded
 
 SEED_DIR = Path(__file__).resolve().parent
 
@@ -26,15 +27,23 @@ def _load_csv(path: Path) -> List[Dict[str, str]]:
 
 def seed_clubs() -> None:
     csv_path = SEED_DIR / "clubs.csv"
-    rows = _load_csv(csv_path)
-
-    if not rows:
-        print("ℹ️ No clubs to seed.")
+    if not csv_path.exists():
+        print("⚠️ clubs.csv not found, skipping seeding.")
         return
 
+    content_hash = file_hash(csv_path)
     session = SessionLocal()
 
     try:
+        if is_seeded(session, "clubs", content_hash):
+            print("ℹ️ clubs.csv unchanged since last seed, skipping.")
+            return
+
+        rows = _load_csv(csv_path)
+        if not rows:
+            print("ℹ️ No clubs to seed.")
+            return
+
         # ✅ SAFE CHECK: if table does NOT exist yet → skip
         try:
             existing_names = {
@@ -72,6 +81,8 @@ def seed_clubs() -> None:
         else:
             print("ℹ️ Clubs already seeded.")
 
+        mark_seeded(session, "clubs", content_hash)
+
     except SQLAlchemyError as e:
         session.rollback()
         print("❌ Seeding failed:", e)
@@ -7,6 +7,7 @@ from sqlalchemy.exc import OperationalError, SQLAlchemyError
 
 from backend.app.database import SessionLocal
 from backend.app.models import Drill
+from backend.app.seed.state import file_hash, is_seeded, mark_seeded
 
 # Use path relative to this file (works locally & on Render)
 CSV_PATH = Path(__file__).resolve().parent / "volleyball_full_transformed.csv"
@@ -25,9 +26,14 @@ def seed_drills() -> None:
         print("⚠️ drills CSV not found, skipping seeding.")
         return
 
+    content_hash = file_hash(CSV_PATH)
     session = SessionLocal()
 
     try:
+        if is_seeded(session, "drills", content_hash):
+            print("ℹ️ Drills CSV unchanged since last seed, skipping.")
+            return
+
         # Fetch existing drill IDs safely
         try:
             existing_ids = {
@@ -94,6 +100,8 @@ def seed_drills() -> None:
         else:
             print("ℹ️ Drills already seeded.")
 
+        mark_seeded(session, "drills", content_hash)
+
     except SQLAlchemyError as exc:
         session.rollback()
         print("❌ Failed to seed drills:", exc)
@@ -0,0 +1,38 @@
+import hashlib
+from pathlib import Path
+
+from sqlalchemy.exc import OperationalError, ProgrammingError
+from sqlalchemy.orm import Session
+
+from backend.app.models import SeedState
+
+
+def file_hash(path: Path) -> str:
+    digest = hashlib.sha256()
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1 << 20), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+def is_seeded(session: Session, name: str, content_hash: str) -> bool:
+    """Single primary-key lookup: was this exact file content already applied?"""
+    try:
+        state = session.get(SeedState, name)
+    except (OperationalError, ProgrammingError):
+        # seed_state not migrated yet -> fall back to the full comparison
+        session.rollback()
+        return False
+    return state is not None and state.content_hash == content_hash
+
+
+def mark_seeded(session: Session, name: str, content_hash: str) -> None:
+    try:
+        state = session.get(SeedState, name)
+        if state is None:
+            session.add(SeedState(name=name, content_hash=content_hash))
+        else:
+            state.content_hash = content_hash
+        session.commit()
+    except (OperationalError, ProgrammingError):
+        session.rollback()
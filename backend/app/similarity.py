@@ -0,0 +1,157 @@
+"""Content-based "similar drills" lookups.
+
+Every drill becomes a unit-length feature vector: weighted one-hot blocks for
+the packed generator tag columns plus min-max normalized complexity,
+decision level and age bounds. Similarity is the cosine, so one lookup is a
+single matrix-vector product followed by ``argpartition`` for the top k.
+
+The matrix follows the drills namespace. When the changed drill ids are
+known (ORM commits), only those rows are re-read and rewritten, into a copy
+of the matrix so lookups running on the current index never see a half
+written row; a tag outside the current vocabulary, or a bulk write without
+ids, triggers a full rebuild.
+"""
+
+import copy
+from typing import Dict, List, Mapping, Optional, Sequence, Set
+
+import numpy as np
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from backend.app.cache import VersionedSnapshot
+from backend.app.models import Drill
+from backend.app.tags import parse_tags
+
+# Relative weight of each feature block in the cosine
+TAG_WEIGHTS = {
+    "skill_domains": 1.0,
+    "game_phases": 1.0,
+    "technical_focus": 0.6,
+    "tactical_focus": 0.6,
+    "position_focus": 0.4,
+    "zone_focus": 0.3,
+}
+NUMERIC_WEIGHTS = {
+    "complexity_level": 1.0,
+    "decision_level": 0.8,
+    "age_min": 0.8,
+    "age_max": 0.8,
+}
+RESULT_COLUMNS = ("id", "name", "category", "level")
+SIMILARITY_COLUMNS = tuple(dict.fromkeys((*RESULT_COLUMNS, *TAG_WEIGHTS, *NUMERIC_WEIGHTS)))
+
+
+class SimilarityIndex:
+    def __init__(self, rows: Sequence[Mapping]):
+        self.vocab: Dict[str, Dict[str, int]] = {}
+        offset = 0
+        for kind in TAG_WEIGHTS:
+            tags = sorted({tag for row in rows for tag in parse_tags(row[kind])})
+            self.vocab[kind] = {tag: offset + i for i, tag in enumerate(tags)}
+            offset += len(tags)
+        self.numeric_offset = offset
+
+        # Scales are fixed at build time so refreshed rows stay comparable
+        self.ranges = {}
+        for name in NUMERIC_WEIGHTS:
+            values = np.array([row[name] for row in rows if row[name] is not None], dtype=np.float64)
+            low, high = (values.min(), values.max()) if len(values) else (0.0, 1.0)
+            self.ranges[name] = (float(low), float(high - low) or 1.0)
+
+        self.width = offset + len(NUMERIC_WEIGHTS)
+        self.features = np.zeros((len(rows), self.width), dtype=np.float32)
+        self.ids = np.array([row["id"] for row in rows], dtype=np.int64)
+        self.active = np.ones(len(rows), dtype=bool)
+        self.results: List[dict] = [{}] * len(rows)
+        self.rows: Dict[int, int] = {}
+        for i, row in enumerate(rows):
+            self._write(i, row)
+
+    @classmethod
+    def from_session(cls, db: Session) -> "SimilarityIndex":
+        columns = [getattr(Drill, name) for name in SIMILARITY_COLUMNS]
+        return cls(db.execute(select(*columns).order_by(Drill.id)).mappings().all())
+
+    def _vector(self, row: Mapping) -> Optional[np.ndarray]:
+        vector = np.zeros(self.width, dtype=np.float32)
+        for kind, weight in TAG_WEIGHTS.items():
+            tags = parse_tags(row[kind])
+            for tag in tags:
+                column = self.vocab[kind].get(tag)
+                if column is None:
+                    return None
+                # Spread the block weight so many tags do not outweigh one
+                vector[column] = weight / np.sqrt(len(tags))
+        for i, (name, weight) in enumerate(NUMERIC_WEIGHTS.items()):
+            low, span = self.ranges[name]
+            value = 0.5 if row[name] is None else min(max((row[name] - low) / span, 0.0), 1.0)
+            vector[self.numeric_offset + i] = weight * value
+        norm = np.linalg.norm(vector)
+        return vector / norm if norm else vector
+
+    def _write(self, index: int, row: Mapping) -> bool:
+        vector = self._vector(row)
+        if vector is None:
+            return False
+        self.features[index] = vector
+        self.results[index] = {name: row[name] for name in RESULT_COLUMNS}
+        self.active[index] = True
+        self.rows[row["id"]] = index
+        return True
+
+    def refresh(self, db: Session, drill_ids: Set[int]) -> Optional["SimilarityIndex"]:
+        """A new index with ``drill_ids`` re-read; None when a rebuild is needed.
+
+        Changes go into copies of the mutable arrays, so this index stays
+        intact for lookups still running on it.
+        """
+        if not drill_ids:
+            return self
+        columns = [getattr(Drill, name) for name in SIMILARITY_COLUMNS]
+        rows = db.execute(select(*columns).where(Drill.id.in_(drill_ids))).mappings().all()
+        if any(row["id"] not in self.rows for row in rows):
+            return None  # new drills change the row layout
+
+        # vocab, ranges and ids never change after the build and stay shared
+        index = copy.copy(self)
+        index.features = self.features.copy()
+        index.active = self.active.copy()
+        index.results = list(self.results)
+        index.rows = dict(self.rows)
+        for row in rows:
+            if not index._write(index.rows[row["id"]], row):
+                return None
+        for drill_id in drill_ids - {row["id"] for row in rows}:
+            position = index.rows.pop(drill_id, None)
+            if position is not None:
+                index.active[position] = False
+        return index
+
+    def similar(self, drill_id: int, limit: int) -> Optional[List[dict]]:
+        """Top ``limit`` most similar drills, best first; None for an unknown drill."""
+        index = self.rows.get(drill_id)
+        if index is None:
+            return None
+
+        scores = self.features @ self.features[index]
+        # Removed drills and the drill itself sort last and are cut below
+        scores[~self.active] = -np.inf
+        scores[index] = -np.inf
+        limit = min(limit, int(self.active.sum()) - 1)
+        if limit <= 0:
+            return []
+        candidates = np.argpartition(-scores, limit - 1)[:limit]
+        candidates = candidates[np.lexsort((self.ids[candidates], -scores[candidates]))]
+        return [{**self.results[i], "score": round(float(scores[i]), 4)} for i in candidates]
+
+
+_snapshot = VersionedSnapshot(
+    "drills",
+    SimilarityIndex.from_session,
+    refresh=lambda index, db, drill_ids: index.refresh(db, drill_ids),
+)
+
+
+def similar_drills(db: Session, drill_id: int, limit: int) -> Optional[List[dict]]:
+    return _snapshot.get(db).similar(drill_id, limit)
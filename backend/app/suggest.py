@@ -0,0 +1,315 @@
+"""Autocomplete for clubs by name and city.
+
+Names and cities are case-folded and transliterated from Bulgarian Cyrillic
+to Latin (the official streamlined system), so "соф", "Sof" and "sof" all
+find "София". Names and cities are also indexed under common informal
+spellings ("CSKA" for "ЦСКА", "Sofiia" for "София"). Every query token must match some name or city token: as a
+prefix, found by bisecting one sorted token list, or with a lower score via
+trigram similarity for near misses such as "sofia" for "sofiya".
+
+The in-memory index follows the clubs namespace: commits that name the
+changed clubs produce a new index in which only those clubs' postings are
+recomputed (the rest is shared or shallow-copied from the previous index),
+so readers keep using the snapshot they started with. With
+``Settings.club_suggest_backend = "pg_trgm"`` the lookup runs in PostgreSQL
+instead, against the trigram GIN index on ``club_search_text(name, city)``
+(migrations 0015 and 0017), which folds case without relying on the
+database locale and holds both the official and the all-informal spelling; word-boundary
+prefixes use a regex match and near misses ``word_similarity``. Databases
+where that migration skipped pg_trgm keep the in-memory index.
+"""
+
+import bisect
+import heapq
+import itertools
+import re
+import unicodedata
+from typing import Dict, List, Mapping, Optional, Sequence, Set, Tuple
+
+from sqlalchemy import case, func, literal, select, text
+from sqlalchemy.orm import Session
+
+from backend.app.cache import VersionedSnapshot
+from backend.app.models import Club
+from backend.app.settings import settings
+
+# Mirrored by the club_search_text() SQL function in migration 0017
+CYRILLIC_TO_LATIN = {
+    "а": "a", "б": "b", "в": "v", "г": "g", "д": "d", "е": "e", "ж": "zh", "з": "z",
+    "и": "i", "й": "y", "к": "k", "л": "l", "м": "m", "н": "n", "о": "o", "п": "p",
+    "р": "r", "с": "s", "т": "t", "у": "u", "ф": "f", "х": "h", "ц": "ts", "ч": "ch",
+    "ш": "sh", "щ": "sht", "ъ": "a", "ь": "y", "ю": "yu", "я": "ya",
+}
+_TRANSLITERATION = str.maketrans(CYRILLIC_TO_LATIN)
+_NON_WORD = re.compile(r"[^a-z0-9]+")
+_WORD = re.compile(r"[^\W_]+")
+
+# Letters people commonly romanize differently, official spelling first
+ROMANIZATION_VARIANTS = {
+    "ц": ("ts", "c"),
+    "я": ("ya", "ia"),
+    "ю": ("yu", "iu"),
+    "ъ": ("a", "u"),
+    "й": ("y", "i"),
+    "х": ("h", "kh"),
+}
+# Words with more ambiguous letters get just the all-official and all-informal spellings
+MAX_WORD_SPELLINGS = 16
+
+NAME_WEIGHT = 2
+CITY_WEIGHT = 1
+MIN_TRIGRAM_SIMILARITY = 0.3
+RESULT_COLUMNS = ("id", "name", "city")
+
+
+def normalize(text: str) -> str:
+    """Case-folded Latin transliteration with punctuation collapsed to spaces."""
+    latin = (text or "").casefold().translate(_TRANSLITERATION)
+    latin = unicodedata.normalize("NFKD", latin).encode("ascii", "ignore").decode()
+    return _NON_WORD.sub(" ", latin).strip()
+
+
+def romanizations(text: str) -> List[Tuple[str, ...]]:
+    """Latin spellings of each word of ``text``, the official one first."""
+    words = []
+    for word in _WORD.findall((text or "").casefold()):
+        ambiguous = [i for i, char in enumerate(word) if char in ROMANIZATION_VARIANTS]
+        choices = [ROMANIZATION_VARIANTS[word[i]] for i in ambiguous]
+        if 2 ** len(ambiguous) <= MAX_WORD_SPELLINGS:
+            combinations = itertools.product(*choices)
+        else:
+            combinations = [tuple(options[0] for options in choices), tuple(options[1] for options in choices)]
+
+        spellings: List[str] = []
+        for combination in combinations:
+            chars = list(word)
+            for i, latin in zip(ambiguous, combination):
+                chars[i] = latin
+            spelled = normalize("".join(chars)).replace(" ", "")
+            if spelled and spelled not in spellings:
+                spellings.append(spelled)
+        if spellings:
+            words.append(tuple(spellings))
+    return words
+
+
+def trigrams(text: str) -> Set[str]:
+    padded = f"  {text} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class ClubSuggestIndex:
+    def __init__(self, rows: Sequence[Mapping]):
+        self.clubs: Dict[int, dict] = {}
+        # club_id -> (name words, city words), each word as its spellings
+        self.tokens: Dict[int, Tuple[List[Tuple[str, ...]], List[Tuple[str, ...]]]] = {}
+        for row in rows:
+            self._add(row)
+        self._reindex()
+
+    @classmethod
+    def from_session(cls, db: Session) -> "ClubSuggestIndex":
+        columns = [getattr(Club, name) for name in RESULT_COLUMNS]
+        return cls(db.execute(select(*columns)).mappings().all())
+
+    def _add(self, row: Mapping) -> None:
+        self.clubs[row["id"]] = {name: row[name] for name in RESULT_COLUMNS}
+        self.tokens[row["id"]] = (romanizations(row["name"]), romanizations(row["city"]))
+
+    @staticmethod
+    def _club_terms(tokens) -> Dict[str, int]:
+        """Term -> weight of the best field it appears in, for one club."""
+        name_tokens, city_tokens = tokens
+        terms: Dict[str, int] = {}
+        for words, weight in ((city_tokens, CITY_WEIGHT), (name_tokens, NAME_WEIGHT)):
+            for spellings in words:
+                for token in spellings:
+                    terms[token] = weight
+        return terms
+
+    def _reindex(self) -> None:
+        # token -> {club_id: weight of the best field it appears in}
+        self.token_clubs: Dict[str, Dict[int, int]] = {}
+        for club_id, tokens in self.tokens.items():
+            for token, weight in self._club_terms(tokens).items():
+                self.token_clubs.setdefault(token, {})[club_id] = weight
+        self.terms = sorted(self.token_clubs)
+
+        self.gram_terms: Dict[str, Set[str]] = {}
+        for term in self.terms:
+            for gram in trigrams(term):
+                self.gram_terms.setdefault(gram, set()).add(term)
+
+    def refresh(self, db: Session, club_ids: Set[int]) -> "ClubSuggestIndex":
+        columns = [getattr(Club, name) for name in RESULT_COLUMNS]
+        rows = db.execute(select(*columns).where(Club.id.in_(club_ids))).mappings().all() if club_ids else []
+        return self.updated(club_ids, rows)
+
+    def updated(self, club_ids: Set[int], rows: Sequence[Mapping]) -> "ClubSuggestIndex":
+        """A new index with ``club_ids`` replaced by ``rows`` (absent ids are removed).
+
+        Only the postings of terms those clubs use are recomputed; inner maps
+        are copied before they change, so this index stays intact for readers.
+        """
+        index = ClubSuggestIndex.__new__(ClubSuggestIndex)
+        index.clubs = dict(self.clubs)
+        index.tokens = dict(self.tokens)
+        index.token_clubs = dict(self.token_clubs)
+        index.gram_terms = dict(self.gram_terms)
+        copied: Set[str] = set()
+
+        def postings(term: str) -> Dict[int, int]:
+            if term not in copied:
+                index.token_clubs[term] = dict(index.token_clubs.get(term, {}))
+                copied.add(term)
+            return index.token_clubs[term]
+
+        for club_id in club_ids:
+            index.clubs.pop(club_id, None)
+            old = index.tokens.pop(club_id, None)
+            if old is not None:
+                for term in self._club_terms(old):
+                    postings(term).pop(club_id, None)
+        for row in rows:
+            index._add(row)
+            for term, weight in self._club_terms(index.tokens[row["id"]]).items():
+                postings(term)[row["id"]] = weight
+
+        emptied = [term for term in copied if not index.token_clubs[term]]
+        for term in emptied:
+            del index.token_clubs[term]
+        added = sorted(term for term in copied if term in index.token_clubs and term not in self.token_clubs)
+        removed = {term for term in emptied if term in self.token_clubs}
+        if removed:
+            index.terms = [term for term in self.terms if term not in removed]
+        index.terms = list(heapq.merge(index.terms if removed else self.terms, added))
+
+        grams: Dict[str, Set[str]] = {}
+        for term in (*added, *removed):
+            for gram in trigrams(term):
+                if gram not in grams:
+                    grams[gram] = set(index.gram_terms.get(gram, ()))
+                if term in removed:
+                    grams[gram].discard(term)
+                else:
+                    grams[gram].add(term)
+        for gram, terms in grams.items():
+            if terms:
+                index.gram_terms[gram] = terms
+            else:
+                index.gram_terms.pop(gram, None)
+        return index
+
+    def _matches(self, token: str) -> Dict[int, float]:
+        """Clubs matching one query token: prefixes score 1, near misses their similarity."""
+        similarity: Dict[str, float] = {}
+        start = bisect.bisect_left(self.terms, token)
+        end = bisect.bisect_left(self.terms, token + "\x7f")
+        for term in self.terms[start:end]:
+            similarity[term] = 1.0
+
+        if len(token) >= 3:
+            grams = trigrams(token)
+            shared: Dict[str, int] = {}
+            for gram in grams:
+                for term in self.gram_terms.get(gram, ()):
+                    shared[term] = shared.get(term, 0) + 1
+            for term, count in shared.items():
+                score = count / (len(grams) + len(trigrams(term)) - count)
+                if score >= MIN_TRIGRAM_SIMILARITY and score > similarity.get(term, 0.0):
+                    similarity[term] = score
+
+        matched: Dict[int, float] = {}
+        for term, score in similarity.items():
+            for club_id, weight in self.token_clubs[term].items():
+                matched[club_id] = max(matched.get(club_id, 0.0), weight * score)
+        return matched
+
+    def suggest(self, query: str, limit: int) -> List[dict]:
+        tokens = normalize(query).split()
+        if not tokens:
+            return []
+
+        scores: Dict[int, float] = {}
+        for position, token in enumerate(tokens):
+            matched = self._matches(token)
+            if position == 0:
+                scores = matched
+            else:
+                scores = {club_id: score + matched[club_id] for club_id, score in scores.items() if club_id in matched}
+            if not scores:
+                return []
+
+        for club_id in scores:
+            name_tokens = self.tokens[club_id][0]
+            if name_tokens and any(spelling.startswith(tokens[0]) for spelling in name_tokens[0]):
+                scores[club_id] += 1
+        ranked = sorted(scores, key=lambda club_id: (-scores[club_id], len(self.clubs[club_id]["name"]), club_id))
+        return [self.clubs[club_id] for club_id in ranked[:limit]]
+
+
+_snapshot = VersionedSnapshot(
+    "clubs",
+    ClubSuggestIndex.from_session,
+    refresh=lambda index, db, club_ids: index.refresh(db, club_ids),
+)
+
+
+# Checked once per process; migration 0015 skips pg_trgm where it is unavailable
+_pg_trgm_ready: Optional[bool] = None
+
+
+def _pg_trgm_available(db: Session) -> bool:
+    global _pg_trgm_ready
+    if _pg_trgm_ready is None:
+        _pg_trgm_ready = bool(
+            db.execute(
+                text(
+                    "SELECT to_regprocedure('club_search_text(text, text)') IS NOT NULL "
+                    "AND EXISTS (SELECT 1 FROM pg_extension WHERE extname = 'pg_trgm')"
+                )
+            ).scalar()
+        )
+        if not _pg_trgm_ready:
+            print("⚠️ pg_trgm or club_search_text() is missing; /clubs/suggest uses the in-memory index.")
+    return _pg_trgm_ready
+
+
+def _suggest_postgres(db: Session, query: str, limit: int) -> List[dict]:
+    tokens = normalize(query).split()
+    if not tokens:
+        return []
+    search_text = func.club_search_text(Club.name, Club.city)
+    name_text = func.club_search_text(Club.name, None)
+    # Lets "token <% text" use the GIN index at the in-memory threshold
+    db.execute(
+        select(func.set_config("pg_trgm.word_similarity_threshold", str(MIN_TRIGRAM_SIMILARITY), True))
+    )
+
+    stmt = select(*(getattr(Club, name) for name in RESULT_COLUMNS))
+    score = literal(0.0)
+    for token in tokens:
+        # Tokens are [a-z0-9] only, so they are safe inside the pattern
+        prefix = f"(^|[^a-z0-9]){token}"
+        stmt = stmt.where(search_text.op("~")(prefix) | literal(token).op("<%")(search_text))
+        score = score + case(
+            (name_text.op("~")(prefix), NAME_WEIGHT),
+            (search_text.op("~")(prefix), CITY_WEIGHT),
+            else_=func.greatest(
+                func.word_similarity(token, name_text) * NAME_WEIGHT,
+                func.word_similarity(token, search_text) * CITY_WEIGHT,
+            ),
+        )
+    score = score + case((name_text.op("~")(f"^{tokens[0]}"), 1), else_=0)
+    stmt = stmt.order_by(score.desc(), func.length(Club.name), Club.id).limit(limit)
+    return [dict(row) for row in db.execute(stmt).mappings()]
+
+
+def suggest_clubs(db: Session, query: str, limit: int) -> List[dict]:
+    if (
+        settings.club_suggest_backend == "pg_trgm"
+        and db.get_bind().dialect.name == "postgresql"
+        and _pg_trgm_available(db)
+    ):
+        return _suggest_postgres(db, query, limit)
+    return _snapshot.get(db).suggest(query, limit)
@@ -0,0 +1,49 @@
+import re
+from typing import Iterable, List, Optional
+
+# Packed "generator" columns on Drill that are mirrored into drill_tags
+TAG_COLUMNS = (
+    "skill_domains",
+    "game_phases",
+    "tactical_focus",
+    "technical_focus",
+    "position_focus",
+    "zone_focus",
+)
+
+TAG_MAX_LENGTH = 100
+
+_SEPARATORS = re.compile(r"[;,]")
+
+
+def parse_tags(value: Optional[str]) -> List[str]:
+    """Split a packed column like ``attack;block, defense`` into normalized tags."""
+    if not value:
+        return []
+
+    tags: List[str] = []
+    for part in _SEPARATORS.split(value):
+        tag = part.strip().lower()[:TAG_MAX_LENGTH]
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
+def parse_tag_query(terms: Iterable[str]) -> List[tuple]:
+    """Parse ``kind:tag`` (or bare ``tag``) query terms into ``(kind, tag)`` pairs.
+
+    ``kind`` is ``None`` for bare terms, which match the tag in any column.
+    Raises ``ValueError`` for unknown kinds.
+    """
+    parsed = []
+    for term in terms:
+        kind, sep, tag = term.partition(":")
+        if not sep:
+            kind, tag = None, kind
+        elif kind not in TAG_COLUMNS:
+            raise ValueError(f"Unknown tag kind '{kind}'")
+
+        tag = tag.strip().lower()
+        if tag:
+            parsed.append((kind, tag))
+    return parsed
@@ -0,0 +1,144 @@
+"""Session-RPE training load and acute:chronic workload analytics.
+
+Each athlete's load for a session is ``rpe * minutes`` (Foster's session-RPE).
+Loads are summed into ``daily_loads`` whenever sessions are written, so
+analytics only read one row per athlete and day. The club-wide series are
+computed in one pass on a date x athlete matrix:
+
+* acute / chronic: rolling 7- and 28-day mean daily load
+* acwr: acute / chronic (null while the chronic load is zero)
+* monotony: 7-day mean / 7-day standard deviation
+* strain: 7-day total load x monotony
+"""
+
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Set, Tuple
+
+import numpy as np
+from sqlalchemy import delete, func, insert, select, tuple_
+from sqlalchemy.orm import Session
+
+from backend.app.models import Athlete, AthleteLoad, DailyLoad, TrainingSession
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+ACUTE_DAYS = 7
+CHRONIC_DAYS = 28
+
+AthleteDay = Tuple[int, date]
+
+
+def session_load(rpe: int, minutes: int) -> int:
+    return rpe * minutes
+
+
+def refresh_daily_loads(db: Session, club_id: int, keys: Iterable[AthleteDay]) -> None:
+    """Recompute the ``daily_loads`` rows for the given (athlete, day) pairs."""
+    keys: Set[AthleteDay] = set(keys)
+    if not keys:
+        return
+
+    match = tuple_(DailyLoad.athlete_id, DailyLoad.date).in_(keys)
+    db.execute(delete(DailyLoad).where(match))
+
+    athlete_day = tuple_(AthleteLoad.athlete_id, TrainingSession.date)
+    totals = db.execute(
+        select(
+            AthleteLoad.athlete_id,
+            TrainingSession.date,
+            func.sum(AthleteLoad.load),
+            func.sum(AthleteLoad.duration_minutes),
+            func.count(),
+        )
+        .join(TrainingSession, TrainingSession.id == AthleteLoad.session_id)
+        .where(athlete_day.in_(keys))
+        .group_by(AthleteLoad.athlete_id, TrainingSession.date)
+    ).all()
+    if totals:
+        db.execute(
+            insert(DailyLoad),
+            [
+                {
+                    "athlete_id": athlete_id,
+                    "date": day,
+                    "club_id": club_id,
+                    "load": load,
+                    "minutes": minutes,
+                    "sessions": sessions,
+                }
+                for athlete_id, day, load, minutes, sessions in totals
+            ],
+        )
+
+
+def _rounded(frame: "pd.DataFrame") -> List[List[Optional[float]]]:
+    """Columns of ``frame`` as lists, with NaN / inf mapped to None."""
+    values = frame.to_numpy(dtype=np.float64).round(3)
+    values[~np.isfinite(values)] = np.nan
+    return [[None if np.isnan(value) else float(value) for value in column] for column in values.T]
+
+
+def load_analytics(db: Session, club_id: int, start: date, end: date, team: Optional[str] = None) -> Dict:
+    """Daily load, ACWR, monotony and strain per athlete of a club, columnar."""
+    # Imported here so pandas only loads once analytics are requested
+    import pandas as pd
+
+    athletes_stmt = select(Athlete.id, Athlete.name, Athlete.team).where(Athlete.club_id == club_id)
+    if team is not None:
+        athletes_stmt = athletes_stmt.where(Athlete.team == team)
+    athletes = db.execute(athletes_stmt.order_by(Athlete.id)).all()
+
+    # Read the chronic window before ``start`` so the first days are complete
+    warmup = start - timedelta(days=CHRONIC_DAYS - 1)
+    rows = db.execute(
+        select(DailyLoad.date, DailyLoad.athlete_id, DailyLoad.load).where(
+            DailyLoad.club_id == club_id,
+            DailyLoad.date.between(warmup, end),
+            DailyLoad.athlete_id.in_([athlete.id for athlete in athletes]),
+        )
+    ).all()
+
+    days = pd.date_range(warmup, end, freq="D")
+    loads = (
+        pd.DataFrame(rows, columns=["date", "athlete_id", "load"])
+        .assign(date=lambda frame: pd.to_datetime(frame["date"]))
+        .pivot_table(index="date", columns="athlete_id", values="load", aggfunc="sum")
+        .reindex(index=days, columns=[athlete.id for athlete in athletes])
+        .fillna(0.0)
+    )
+
+    acute = loads.rolling(ACUTE_DAYS).mean()
+    chronic = loads.rolling(CHRONIC_DAYS).mean()
+    weekly_std = loads.rolling(ACUTE_DAYS).std()
+    acwr = acute / chronic.where(chronic > 0)
+    monotony = acute / weekly_std.where(weekly_std > 0)
+    strain = loads.rolling(ACUTE_DAYS).sum() * monotony
+
+    visible = days >= pd.Timestamp(start)
+    series = {
+        name: _rounded(frame[visible])
+        for name, frame in (
+            ("load", loads),
+            ("acute", acute),
+            ("chronic", chronic),
+            ("acwr", acwr),
+            ("monotony", monotony),
+            ("strain", strain),
+        )
+    }
+    return {
+        "club_id": club_id,
+        "start": start,
+        "end": end,
+        "dates": [day.date() for day in days[visible]],
+        "athletes": [
+            {
+                "athlete_id": athlete.id,
+                "name": athlete.name,
+                "team": athlete.team,
+                **{name: columns[i] for name, columns in series.items()},
+            }
+            for i, athlete in enumerate(athletes)
+        ],
+    }
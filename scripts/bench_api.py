@@ -0,0 +1,244 @@
+"""Reproducible API load benchmark against an in-process ASGI app.
+
+Builds a synthetic catalog (``--scale`` drills plus proportional clubs and
+users, see ``synthetic_catalog.py``) in a scratch SQLite database unless
+``--database-url`` is given, then drives the hot endpoints through
+``httpx.ASGITransport`` with ``--concurrency`` requests in flight:
+
+    poetry run python scripts/bench_api.py --scale 1000 10000 --output bench.json
+    poetry run python scripts/bench_api.py --scale 10000 --baseline bench.json --max-regression 0.25
+
+Results (p50/p99 latency and throughput per endpoint and scale) are written
+as JSON. With ``--baseline`` the run exits with status 1 when any p50 or p99
+is more than ``--max-regression`` slower than the baseline.
+
+Every table is emptied before each scale is filled, so a ``--database-url``
+that points at an existing database is refused unless
+``--i-know-this-wipes-data`` is also given.
+"""
+
+import argparse
+import asyncio
+import json
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Dict, List
+
+# Login is dominated by bcrypt, so it gets a fraction of the request budget
+LOGIN_SHARE = 0.1
+
+
+def percentile(samples: List[float], fraction: float) -> float:
+    ordered = sorted(samples)
+    index = min(int(round(fraction * (len(ordered) - 1))), len(ordered) - 1)
+    return ordered[index]
+
+
+async def run_scenario(client, requests: int, concurrency: int, make_request) -> Dict[str, float]:
+    latencies: List[float] = []
+    errors = 0
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(index: int) -> None:
+        nonlocal errors
+        async with semaphore:
+            started = time.perf_counter()
+            response = await make_request(client, index)
+            latencies.append(time.perf_counter() - started)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(one(index) for index in range(requests)))
+    elapsed = time.perf_counter() - started
+    return {
+        "requests": requests,
+        "errors": errors,
+        "p50_ms": round(percentile(latencies, 0.50) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 0.99) * 1000, 3),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3),
+        "throughput_rps": round(requests / elapsed, 1),
+    }
+
+
+async def bench_scale(app, counts: Dict[str, int], password: str, requests: int, concurrency: int, seed: int):
+    import httpx
+
+    rng = random.Random(seed)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        login = await client.post("/auth/login", json={"email": "coach1@example.bg", "password": password})
+        login.raise_for_status()
+        auth = {"Authorization": f"Bearer {login.json()['access_token']}"}
+
+        def drills(client, index):
+            # Random cursors spread requests over many cache keys
+            return client.get("/drills/", params={"after": rng.randint(0, counts["drills"]), "limit": 50})
+
+        def clubs(client, index):
+            return client.get("/clubs/")
+
+        def auth_login(client, index):
+            email = f"coach{rng.randint(1, counts['users'])}@example.bg"
+            return client.post("/auth/login", json={"email": email, "password": password})
+
+        def auth_me(client, index):
+            return client.get("/auth/me", headers=auth)
+
+        scenarios = {
+            "GET /drills/": (drills, requests),
+            "GET /clubs/": (clubs, requests),
+            "POST /auth/login": (auth_login, max(int(requests * LOGIN_SHARE), 5)),
+            "GET /auth/me": (auth_me, requests),
+        }
+        results = {}
+        for name, (make_request, count) in scenarios.items():
+            results[name] = await run_scenario(client, count, concurrency, make_request)
+        return results
+
+
+def prepare_database(database_url: str, scale: int, password: str) -> Dict[str, int]:
+    from sqlalchemy import create_engine, delete
+    from sqlalchemy.orm import Session
+
+    from backend.app.auth import get_password_hash
+    from backend.app.cache import catalog_cache
+    from backend.app.database import Base
+    from synthetic_catalog import populate
+
+    engine = create_engine(database_url)
+    Base.metadata.create_all(engine)
+    with Session(engine) as session:
+        for table in reversed(Base.metadata.sorted_tables):
+            session.execute(delete(table))
+        counts = populate(session, scale, get_password_hash(password))
+    engine.dispose()
+    for namespace in ("drills", "clubs"):
+        catalog_cache.bump(namespace)
+    return counts
+
+
+def is_scratch_url(database_url: str) -> bool:
+    """True for an in-memory SQLite database or a SQLite file that does not exist yet."""
+    from sqlalchemy.engine import make_url
+
+    url = make_url(database_url)
+    if url.get_backend_name() != "sqlite":
+        return False
+    return url.database in (None, "", ":memory:") or not Path(url.database).exists()
+
+
+def git_revision() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+
+def regressions(results: dict, baseline: dict, threshold: float) -> List[str]:
+    failures = []
+    for scale, scenarios in results["scales"].items():
+        for name, current in scenarios.items():
+            previous = baseline.get("scales", {}).get(scale, {}).get(name)
+            if not previous:
+                continue
+            for metric in ("p50_ms", "p99_ms"):
+                limit = previous[metric] * (1 + threshold)
+                if current[metric] > limit:
+                    failures.append(
+                        f"{scale} drills | {name} {metric} {current[metric]:.2f} > {limit:.2f} "
+                        f"(baseline {previous[metric]:.2f})"
+                    )
+    return failures
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--scale", type=int, nargs="+", default=[1000, 10000, 100000])
+    parser.add_argument("--requests", type=int, default=500, help="requests per endpoint")
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--database-url", help="existing database to (re)fill; default is scratch SQLite")
+    parser.add_argument(
+        "--i-know-this-wipes-data",
+        action="store_true",
+        help="allow --database-url to point at an existing database; every table in it is emptied",
+    )
+    parser.add_argument("--password", default="benchmark-password")
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--output", type=Path)
+    parser.add_argument("--baseline", type=Path)
+    parser.add_argument("--max-regression", type=float, default=0.25, help="allowed slowdown, 0.25 = 25%%")
+    args = parser.parse_args()
+    if args.database_url and not args.i_know_this_wipes_data and not is_scratch_url(args.database_url):
+        parser.error(
+            f"--database-url {args.database_url!r} is not a new SQLite database and every table in it "
+            "would be emptied; pass --i-know-this-wipes-data to run against it anyway"
+        )
+
+    scratch = tempfile.TemporaryDirectory()
+    database_url = args.database_url or f"sqlite:///{scratch.name}/bench.db"
+    # Settings are read at import time, so the URL must be set before the app loads
+    os.environ["DATABASE_URL"] = database_url
+    # Every request comes from one in-process client, so the login limiter and
+    # bcrypt gate would turn the login scenario into 429/503s; the benchmark
+    # measures the handler, not admission control
+    os.environ["LOGIN_RATE_LIMIT_BACKEND"] = "local"
+    os.environ["LOGIN_IP_BURST"] = os.environ["LOGIN_EMAIL_BURST"] = str(10**9)
+    os.environ["BCRYPT_MAX_IN_FLIGHT"] = str(args.concurrency + 1)
+
+    from backend.app.main import app
+
+    results = {
+        "meta": {
+            "revision": git_revision(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "python": platform.python_version(),
+            "database": database_url.split(":", 1)[0],
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "seed": args.seed,
+        },
+        "scales": {},
+    }
+    try:
+        for scale in args.scale:
+            counts = prepare_database(database_url, scale, args.password)
+            scenarios = asyncio.run(
+                bench_scale(app, counts, args.password, args.requests, args.concurrency, args.seed)
+            )
+            results["scales"][str(scale)] = scenarios
+            for name, stats in scenarios.items():
+                print(
+                    f"{scale:>7} drills | {name:<17} | p50 {stats['p50_ms']:8.2f} ms | "
+                    f"p99 {stats['p99_ms']:8.2f} ms | {stats['throughput_rps']:8.1f} req/s | "
+                    f"{stats['errors']} errors"
+                )
+    finally:
+        scratch.cleanup()
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2), encoding="utf-8")
+        print(f"✅ Results written to {args.output}")
+
+    if args.baseline:
+        failures = regressions(results, json.loads(args.baseline.read_text(encoding="utf-8")), args.max_regression)
+        for failure in failures:
+            print(f"❌ Regression: {failure}")
+        if failures:
+            return 1
+        print(f"✅ No regression above {args.max_regression:.0%} against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Benchmark training-plan generation latency against catalog size.
+
+Builds synthetic in-memory catalogs (no database needed) and times
+``generate_plan`` for each size:
+
+    poetry run python scripts/bench_generator.py --sizes 1000 10000 50000
+"""
+
+import argparse
+import statistics
+import time
+
+from backend.app.catalog import DrillCatalog
+from backend.app.generator import generate_plan
+from synthetic_catalog import synthetic_drills
+
+def bench(size: int, repeats: int) -> None:
+    started = time.perf_counter()
+    catalog = DrillCatalog(synthetic_drills(size))
+    build_ms = (time.perf_counter() - started) * 1000
+
+    timings = []
+    for _ in range(repeats):
+        started = time.perf_counter()
+        generate_plan(
+            catalog,
+            duration=90,
+            age=14,
+            focus=["attack", "block"],
+            intensity_curve=["low", "high", "medium"],
+        )
+        timings.append((time.perf_counter() - started) * 1000)
+
+    timings.sort()
+    p95 = timings[int(len(timings) * 0.95) - 1] if len(timings) >= 20 else timings[-1]
+    print(
+        f"{size:>8} drills | build {build_ms:8.1f} ms | "
+        f"generate p50 {statistics.median(timings):6.2f} ms  p95 {p95:6.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 50_000])
+    parser.add_argument("--repeats", type=int, default=50)
+    args = parser.parse_args()
+
+    for size in args.sizes:
+        bench(size, args.repeats)
@@ -0,0 +1,57 @@
+"""Benchmark CSV import throughput (rows/second) on a scratch SQLite database.
+
+Writes a synthetic drills CSV, then times a dry run, the initial insert and
+a no-op re-import. Nothing touches DATABASE_URL:
+
+    poetry run python scripts/bench_import.py --rows 10000 50000
+"""
+
+import argparse
+import csv
+import tempfile
+from pathlib import Path
+
+from sqlalchemy import create_engine
+from sqlalchemy.orm import sessionmaker
+
+from backend.app.database import Base
+from backend.app.importer import DRILL_IMPORT, import_path
+from synthetic_catalog import synthetic_drills
+
+
+def write_csv(path: Path, rows: int) -> None:
+    records = synthetic_drills(rows)
+    with path.open("w", encoding="utf-8", newline="") as handle:
+        writer = csv.DictWriter(handle, fieldnames=list(records[0]))
+        writer.writeheader()
+        writer.writerows(records)
+
+
+def bench(rows: int, chunk_size: int) -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        csv_path = Path(tmp) / "drills.csv"
+        write_csv(csv_path, rows)
+
+        engine = create_engine(f"sqlite:///{tmp}/bench.db")
+        Base.metadata.create_all(engine)
+        session = sessionmaker(bind=engine)()
+        try:
+            for label, dry_run in (("dry run", True), ("insert", False), ("re-import", False)):
+                report = import_path(session, str(csv_path), DRILL_IMPORT, dry_run=dry_run, chunk_size=chunk_size)
+                print(
+                    f"{rows:>8} rows | {label:<9} | {report.elapsed_seconds:7.2f} s | "
+                    f"{report.rows_per_second:>10,.0f} rows/s"
+                )
+        finally:
+            session.close()
+            engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--rows", type=int, nargs="+", default=[10_000, 50_000])
+    parser.add_argument("--chunk-size", type=int, default=2000)
+    args = parser.parse_args()
+
+    for size in args.rows:
+        bench(size, args.chunk_size)
@@ -0,0 +1,54 @@
+"""Spot checks for club autocomplete across Cyrillic and Latin spellings.
+
+Builds the in-memory suggest index from a few fixed clubs (no database
+needed) and verifies that common queries find them:
+
+    poetry run python scripts/check_suggest.py
+
+Exits with status 1 when any expected club is missing from the results.
+"""
+
+import sys
+
+from backend.app.suggest import ClubSuggestIndex
+
+CLUBS = [
+    {"id": 1, "name": "ВК ЦСКА", "city": "София"},
+    {"id": 2, "name": "ВК Левски София", "city": "София"},
+    {"id": 3, "name": "ВК Марица", "city": "Пловдив"},
+    {"id": 4, "name": "ВК Юнак", "city": "Ямбол"},
+    {"id": 5, "name": "ВК Черно море", "city": "Варна"},
+]
+
+# query -> id that must be among the results
+EXPECTED = {
+    "cska": 1,
+    "tsska": 1,
+    "ЦСКА": 1,
+    "levski": 2,
+    "Левски": 2,
+    "levski sof": 2,
+    "sofia": 2,
+    "sofiya": 2,
+    "sofiia": 2,
+    "plovdiv": 3,
+    "iunak": 4,
+    "yunak": 4,
+    "iambol": 4,
+    "cherno more": 5,
+}
+
+
+def main() -> int:
+    index = ClubSuggestIndex(CLUBS)
+    failed = 0
+    for query, club_id in EXPECTED.items():
+        found = [club["id"] for club in index.suggest(query, limit=10)]
+        ok = club_id in found
+        failed += not ok
+        print(f"{'✅' if ok else '❌'} {query!r:<14} -> {found}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,49 @@
+"""Bulk import drills or clubs from a CSV file.
+
+Reports a dry-run diff by default; pass --commit to write:
+
+    DATABASE_URL=postgresql+psycopg://... \
+    poetry run python scripts/import_catalog.py drills library.csv --commit
+"""
+
+import argparse
+import json
+import sys
+
+from backend.app.database import SessionLocal
+from backend.app.importer import DEFAULT_CHUNK_SIZE, import_path, spec_for
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("kind", choices=["drills", "clubs"])
+    parser.add_argument("path")
+    parser.add_argument("--commit", action="store_true", help="Write changes (default is a dry run)")
+    parser.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE)
+    args = parser.parse_args()
+
+    def progress(report):
+        print(f"… {report.rows_read} rows read", file=sys.stderr)
+
+    session = SessionLocal()
+    try:
+        report = import_path(
+            session,
+            args.path,
+            spec_for(args.kind),
+            dry_run=not args.commit,
+            chunk_size=args.chunk_size,
+            on_chunk=progress,
+        )
+    except ValueError as exc:
+        print(f"❌ Import failed: {exc}", file=sys.stderr)
+        return 1
+    finally:
+        session.close()
+
+    print(json.dumps(report.summary(), ensure_ascii=False, indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,82 @@
+"""Apply pending migrations, skipping Alembic entirely when already at head.
+
+Deploys run this before every start. The head revision comes from parsing
+the migration scripts and the stored revision from one raw DBAPI query, so
+the common nothing-to-do case needs neither a SQLAlchemy engine nor env.py:
+
+    poetry run python scripts/migrate.py           # upgrade only if behind
+    poetry run python scripts/migrate.py --check   # exit 1 if behind, change nothing
+"""
+
+import argparse
+import sqlite3
+import sys
+import time
+from pathlib import Path
+from typing import Set
+
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
+from sqlalchemy.engine import make_url
+
+from backend.app.settings import settings
+
+
+def alembic_config() -> Config:
+    config = Config(str(settings.alembic_ini_path))
+    config.set_main_option("script_location", str(settings.migrations_path))
+    return config
+
+
+def head_revisions(config: Config) -> Set[str]:
+    return set(ScriptDirectory.from_config(config).get_heads())
+
+
+def stored_revisions(database_url: str) -> Set[str]:
+    """Revisions in ``alembic_version``; empty for a fresh database."""
+    url = make_url(database_url)
+    if url.get_backend_name() == "sqlite":
+        if not url.database or not Path(url.database).exists():
+            return set()
+        conn, missing_table = sqlite3.connect(url.database), sqlite3.OperationalError
+    else:
+        import psycopg
+
+        conn = psycopg.connect(url.set(drivername="postgresql").render_as_string(hide_password=False))
+        missing_table = psycopg.errors.UndefinedTable
+    try:
+        cursor = conn.cursor()
+        cursor.execute("SELECT version_num FROM alembic_version")
+        return {row[0] for row in cursor.fetchall()}
+    except missing_table:
+        return set()
+    finally:
+        conn.close()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--check", action="store_true", help="only report; exit 1 when migrations are pending")
+    args = parser.parse_args()
+
+    started = time.perf_counter()
+    config = alembic_config()
+    heads = head_revisions(config)
+    stored = stored_revisions(settings.database_url)
+    elapsed_ms = (time.perf_counter() - started) * 1000
+
+    if stored == heads:
+        print(f"✅ Database already at head ({', '.join(sorted(heads))}); checked in {elapsed_ms:.0f} ms")
+        return 0
+
+    print(f"ℹ️ Database at {', '.join(sorted(stored)) or 'no revision'}, head is {', '.join(sorted(heads))}")
+    if args.check:
+        return 1
+    command.upgrade(config, "head")
+    print(f"✅ Migrated to head in {time.perf_counter() - started:.1f} s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,126 @@
+"""Synthetic clubs, users and drills for benchmarks.
+
+Rows look like the real catalog: semicolon-packed generator columns,
+Bulgarian free text and plausible age / duration / load ranges. Output is
+deterministic for a given seed so runs are comparable between commits.
+"""
+
+import random
+from typing import Dict, List
+
+from sqlalchemy import insert
+from sqlalchemy.orm import Session
+
+from backend.app.importer import DRILL_IMPORT, upsert_records
+from backend.app.models import Club, User, UserRole
+
+DOMAINS = ["attack", "block", "defense", "serve", "reception", "setting", "transition"]
+PHASES = ["side_out", "break_point", "transition", "free_ball"]
+TACTICAL = ["zone_defense", "quick_attack", "combination", "serve_pressure", "cover"]
+TECHNICAL = ["overhand_pass", "forearm_pass", "spike", "jump_serve", "float_serve", "dig"]
+POSITIONS = ["setter", "opposite", "outside", "middle", "libero"]
+ZONES = ["1", "2", "3", "4", "5", "6"]
+INTENSITIES = ["low", "medium", "high"]
+CATEGORIES = ["Атака", "Блокада", "Защита", "Сервис", "Посрещане", "Разпределение"]
+LEVELS = ["Начинаещи", "Средно напреднали", "Напреднали"]
+CITIES = ["София", "Пловдив", "Варна", "Бургас", "Русе", "Стара Загора", "Плевен", "Шумен"]
+
+PHRASES = [
+    "Подаване и посрещане в зона 5 с последваща атака от зона 4.",
+    "Играчите се редуват на блокада срещу бърза атака в центъра.",
+    "Защита на полето след силен сервис с прехвърляне в контраатака.",
+    "Разпределителят избира между комбинация и висока топка към крилото.",
+    "Упражнението развива реакцията и придвижването в задна линия.",
+    "Серия от десет сервиса с изискване за точност в зони 1 и 5.",
+    "Треньорът подава топки от отсрещното поле с променлива траектория.",
+]
+
+def _packed(rng: random.Random, values: List[str], low: int, high: int) -> str:
+    return ";".join(rng.sample(values, rng.randint(low, high)))
+
+
+def synthetic_drills(count: int, seed: int = 42) -> List[Dict[str, object]]:
+    rng = random.Random(seed)
+    rows = []
+    for drill_id in range(1, count + 1):
+        age_min = rng.randint(8, 18)
+        duration_min = rng.randint(5, 15)
+        rows.append(
+            {
+                "id": drill_id,
+                "name": f"{rng.choice(CATEGORIES)} – упражнение {drill_id}",
+                "category": rng.choice(CATEGORIES),
+                "level": rng.choice(LEVELS),
+                "skill_focus": rng.choice(PHRASES),
+                "goal": rng.choice(PHRASES),
+                "description": " ".join(rng.sample(PHRASES, 3)),
+                "variations": rng.choice(PHRASES),
+                "players": str(rng.randint(2, 12)),
+                "equipment": "топки;конуси",
+                "rpe": str(rng.randint(3, 9)),
+                "duration_min": duration_min,
+                "duration_max": duration_min + rng.randint(0, 15),
+                "skill_domains": _packed(rng, DOMAINS, 1, 3),
+                "game_phases": _packed(rng, PHASES, 1, 2),
+                "tactical_focus": _packed(rng, TACTICAL, 0, 2),
+                "technical_focus": _packed(rng, TECHNICAL, 1, 2),
+                "position_focus": _packed(rng, POSITIONS, 0, 2),
+                "zone_focus": _packed(rng, ZONES, 1, 3),
+                "complexity_level": rng.randint(1, 5),
+                "decision_level": rng.randint(1, 5),
+                "age_min": age_min,
+                "age_max": age_min + rng.randint(2, 10),
+                "intensity_type": rng.choice(INTENSITIES),
+                "training_goal": rng.choice(PHRASES),
+                "type_of_drill": rng.choice(["drill", "game", "circuit"]),
+            }
+        )
+    return rows
+
+
+def synthetic_clubs(count: int, seed: int = 42) -> List[Dict[str, object]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": club_id,
+            "name": f"ВК {rng.choice(CITIES)} {club_id}",
+            "city": rng.choice(CITIES),
+            "country": "Bulgaria",
+            "contact_email": f"club{club_id}@example.bg",
+        }
+        for club_id in range(1, count + 1)
+    ]
+
+
+def synthetic_users(count: int, clubs: int, password_hash: str, seed: int = 42) -> List[Dict[str, object]]:
+    rng = random.Random(seed)
+    return [
+        {
+            "id": user_id,
+            "email": f"coach{user_id}@example.bg",
+            "password_hash": password_hash,
+            "name": f"Треньор {user_id}",
+            "role": UserRole.coach,
+            "club_id": rng.randint(1, clubs) if clubs else None,
+        }
+        for user_id in range(1, count + 1)
+    ]
+
+
+def populate(session: Session, drills: int, password_hash: str, batch_size: int = 5000) -> Dict[str, int]:
+    """Insert a catalog of ``drills`` drills plus proportional clubs and users."""
+    clubs = max(drills // 100, 1)
+    users = max(drills // 10, 1)
+
+    def chunks(rows):
+        for start in range(0, len(rows), batch_size):
+            yield rows[start:start + batch_size]
+
+    for batch in chunks(synthetic_clubs(clubs)):
+        session.execute(insert(Club), batch)
+    for batch in chunks(synthetic_users(users, clubs, password_hash)):
+        session.execute(insert(User), batch)
+    for batch in chunks(synthetic_drills(drills)):
+        upsert_records(session, DRILL_IMPORT, batch)
+    session.commit()
+    return {"clubs": clubs, "users": users, "drills": drills}